@@ -0,0 +1,41 @@
+"""
+Opt-in persistent HTTP cache for the smoke-test scripts.
+
+The test scripts query the live literature APIs with fixed queries, so
+repeated runs fetch the same responses. With TEST_HTTP_CACHE=1 set, every
+``requests`` call (Semantic Scholar, Europe PMC, NCBI E-utilities pings) is
+served from a local SQLite cache for an hour, keyed on the full URL
+including the query string. Bio.Entrez uses urllib and is not cached.
+"""
+import os
+from pathlib import Path
+
+CACHE_NAME = str(Path(__file__).parent / ".test_http_cache")
+
+
+def install_test_cache(expire_after: int = 3600) -> bool:
+    """
+    Route requests through a persistent cache if TEST_HTTP_CACHE=1.
+
+    Args:
+        expire_after: Seconds before a cached response is refetched
+
+    Returns:
+        True if the cache was installed
+    """
+    if os.getenv("TEST_HTTP_CACHE") != "1":
+        return False
+
+    try:
+        import requests_cache
+    except ImportError:
+        print("⚠️  TEST_HTTP_CACHE=1 but requests-cache is not installed; running uncached")
+        return False
+
+    # Patches requests.Session, which requests.get() uses under the hood
+    requests_cache.install_cache(
+        CACHE_NAME,
+        backend="sqlite",
+        expire_after=expire_after
+    )
+    return True
@@ -0,0 +1,59 @@
+"""
+Shared HTTP session for the literature API clients.
+
+All REST clients send their requests through one pooled ``requests``
+session, so keep-alive connections (and their TLS handshakes) are reused
+across clients and threads instead of being set up again on every call.
+Response bodies are decoded with ``src.utils.json_utils.loads``.
+"""
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.json_utils import loads as json_loads
+
+# Connections kept open per host; UnifiedSearchClient runs one thread per source
+POOL_MAXSIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_client() -> requests.Session:
+    """
+    Get or create the process-wide HTTP session.
+
+    The session is created on first use, so a cache installed beforehand
+    with ``requests_cache.install_cache`` also applies to it.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def close_client():
+    """Close the shared session and its pooled connections."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+atexit.register(close_client)
@@ -147,12 +147,7 @@ class BaseLiteratureClient(ABC):
 
         # Fetch from API
         logger.info(f"Cache miss - fetching from {self.get_source_name()} API")
-        ids = self.search(query, max_results, **kwargs)
-
-        if not ids:
-            return []
-
-        articles = self.fetch_details(ids)
+        articles = self._search_articles(query, max_results, **kwargs)
         results = [article.to_dict() for article in articles]
 
         # Cache the results
@@ -165,6 +160,29 @@ class BaseLiteratureClient(ABC):
 
         return results
 
+    def _search_articles(
+        self,
+        query: str,
+        max_results: int = 10,
+        **kwargs
+    ) -> List[Article]:
+        """
+        Run the uncached search behind search_and_fetch().
+
+        Defaults to search() followed by fetch_details(); sources whose
+        search endpoint can return full records override this to save the
+        per-article requests.
+
+        Returns:
+            List of Article objects
+        """
+        ids = self.search(query, max_results, **kwargs)
+
+        if not ids:
+            return []
+
+        return self.fetch_details(ids)
+
     @abstractmethod
     def get_source_name(self) -> str:
         """
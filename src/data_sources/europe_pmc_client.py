@@ -6,10 +6,11 @@ PubMed, PMC full texts, and preprints from bioRxiv and medRxiv.
 
 API Docs: https://europepmc.org/RestfulWebService
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import requests
 import time
 import logging
+from ._http import get_client, json_loads
 from .base_client import BaseLiteratureClient, Article
 
 logger = logging.getLogger(__name__)
@@ -73,9 +74,9 @@ class EuropePMCClient(BaseLiteratureClient):
 
         try:
             url = f"{self.BASE_URL}/{endpoint}"
-            response = requests.get(url, params=params, timeout=30)
+            response = get_client().get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
 
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error: {e}")
@@ -137,6 +138,68 @@ class EuropePMCClient(BaseLiteratureClient):
             logger.error(f"Search failed: {e}")
             return []
 
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = 25,
+        sort: str = "relevance",
+        max_results: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Stream articles matching query using cursor-based pagination.
+
+        Details are fetched one article at a time as the caller consumes
+        them, and the next page is only requested once the current one is
+        exhausted. The stream ends if none of a page's details can be
+        fetched, rather than paging on through the rest of the result set.
+        Results are not cached.
+
+        Args:
+            query: Search query
+            page_size: Number of results per search request (max 1000)
+            sort: Sort order (relevance, cited, date)
+            max_results: Stop after this many search results (None for no limit)
+
+        Yields:
+            Article dictionaries
+        """
+        cursor = '*'
+        seen = 0
+
+        while max_results is None or seen < max_results:
+            limit = page_size if max_results is None else min(page_size, max_results - seen)
+            params = {
+                'query': query,
+                'pageSize': min(limit, 1000),
+                'cursorMark': cursor,
+                'sort': sort
+            }
+            data = self._make_request('search', params)
+
+            if not data or 'resultList' not in data:
+                return
+
+            results = data['resultList'].get('result', [])[:limit]
+            fetched = 0
+            for result in results:
+                if 'id' in result:
+                    article_id = f"{result.get('source', 'MED')}:{result['id']}"
+                    for article in self.fetch_details([article_id]):
+                        fetched += 1
+                        yield article.to_dict()
+
+            if results and not fetched:
+                logger.error("Europe PMC details fetch failed for a whole page; stopping the stream")
+                return
+            seen += len(results)
+
+            # The cursor stops advancing once the last page has been served
+            next_cursor = data.get('nextCursorMark')
+            if not results or not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
+
     def fetch_details(self, ids: List[str]) -> List[Article]:
         """
         Fetch detailed information for articles.
@@ -249,7 +312,7 @@ class EuropePMCClient(BaseLiteratureClient):
                 source, id_num = 'PMC', article_id
 
             endpoint = f'{source}/{id_num}/fullTextXML'
-            response = requests.get(f"{self.BASE_URL}/{endpoint}", timeout=30)
+            response = get_client().get(f"{self.BASE_URL}/{endpoint}", timeout=30)
 
             if response.status_code == 200:
                 return response.text
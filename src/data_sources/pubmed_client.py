@@ -9,13 +9,16 @@ Improvements:
 - Improved logging
 - Added batch fetching optimization
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from Bio import Entrez, Medline
 import os
 import logging
 import time
 from datetime import datetime
 import json
+import xml.etree.ElementTree as ET
+
+from ._http import get_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +30,7 @@ class PubMedClient:
 
     # NCBI recommends max 3 requests per second without API key
     REQUEST_DELAY = 0.34  # ~3 requests per second
+    EINFO_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/einfo.fcgi"
 
     def __init__(self, email: Optional[str] = None, enable_cache: bool = True):
         """
@@ -67,6 +71,36 @@ class PubMedClient:
 
         self._last_request_time = time.time()
 
+    def ping(self, timeout: float = 10) -> bool:
+        """
+        Check that the E-utilities endpoint is reachable.
+
+        Uses EInfo, which only returns database metadata, so no search
+        runs on the NCBI side.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if EInfo answered with a DbInfo record for PubMed
+        """
+        params = {"db": "pubmed", "tool": Entrez.tool, "email": self.email}
+        if Entrez.api_key:
+            params["api_key"] = Entrez.api_key
+
+        try:
+            self._rate_limit()
+            response = get_client().get(self.EINFO_URL, params=params, timeout=timeout)
+            if response.status_code != 200:
+                logger.warning(f"PubMed EInfo returned HTTP {response.status_code}")
+                return False
+
+            return ET.fromstring(response.content).find("DbInfo") is not None
+
+        except Exception as e:
+            logger.warning(f"PubMed ping failed: {e}")
+            return False
+
     def search(
         self,
         query: str,
@@ -139,6 +173,8 @@ class PubMedClient:
             return []
 
         try:
+            self._rate_limit()
+
             # Fetch in MEDLINE format
             handle = Entrez.efetch(
                 db="pubmed",
@@ -160,6 +196,77 @@ class PubMedClient:
             print(f"Error fetching details: {e}")
             return []
 
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = 25,
+        sort: str = "relevance",
+        min_date: Optional[str] = None,
+        max_date: Optional[str] = None,
+        max_results: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Stream articles matching query, one page of PMIDs at a time.
+
+        Pages are only requested as the caller consumes articles, so
+        stopping early (e.g. with itertools.islice) skips later pages.
+        The stream ends if a page's details can't be fetched, rather than
+        paging on through the rest of the result set. Results are not
+        cached.
+
+        Args:
+            query: Search query (supports PubMed syntax)
+            page_size: Number of PMIDs fetched per request
+            sort: Sort order ('relevance', 'pub_date', 'first_author')
+            min_date: Minimum publication date (YYYY/MM/DD)
+            max_date: Maximum publication date (YYYY/MM/DD)
+            max_results: Stop after this many PMIDs (None for no limit)
+
+        Yields:
+            Article details as dictionaries
+        """
+        retstart = 0
+
+        while max_results is None or retstart < max_results:
+            retmax = page_size if max_results is None else min(page_size, max_results - retstart)
+
+            try:
+                self._rate_limit()
+
+                handle = Entrez.esearch(
+                    db="pubmed",
+                    term=query,
+                    retstart=retstart,
+                    retmax=retmax,
+                    sort=sort,
+                    mindate=min_date,
+                    maxdate=max_date,
+                    datetype="pdat"
+                )
+                record = Entrez.read(handle)
+                handle.close()
+
+            except Exception as e:
+                logger.error(f"PubMed paged search failed at offset {retstart}: {e}")
+                return
+
+            pmids = record["IdList"]
+            if not pmids:
+                return
+
+            articles = self.fetch_details(pmids)
+            if not articles:
+                logger.error(
+                    f"PubMed details fetch failed at offset {retstart}; stopping the stream"
+                )
+                return
+            yield from articles
+
+            retstart += len(pmids)
+            if retstart >= int(record.get("Count", 0)):
+                return
+
     def _parse_medline_record(self, record: Dict) -> Dict:
         """Parse MEDLINE record into standardized format."""
         return {
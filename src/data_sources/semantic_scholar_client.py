@@ -6,10 +6,11 @@ Semantic Scholar is a free AI-powered research tool that indexes
 
 API Docs: https://api.semanticscholar.org/
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import requests
 import time
 import logging
+from ._http import get_client, json_loads
 from .base_client import BaseLiteratureClient, Article
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ class SemanticScholarClient(BaseLiteratureClient):
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
     REQUEST_DELAY = 0.1  # 10 requests per second (free tier)
+    PAPER_FIELDS = 'paperId,title,abstract,authors,year,journal,citationCount,openAccessPdf,externalIds,url'
 
     def __init__(
         self,
@@ -73,9 +75,9 @@ class SemanticScholarClient(BaseLiteratureClient):
 
         try:
             url = f"{self.BASE_URL}{endpoint}"
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = get_client().get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:
@@ -110,10 +112,42 @@ class SemanticScholarClient(BaseLiteratureClient):
         Returns:
             List of paper IDs
         """
+        params = self._search_params(
+            query, min(max_results, 100), year, fields_of_study, open_access_only
+        )
+
+        try:
+            logger.info(f"Searching Semantic Scholar: '{query}' (max={max_results})")
+
+            data = self._make_request('/paper/search', params)
+
+            if not data or 'data' not in data:
+                logger.warning("No results returned")
+                return []
+
+            paper_ids = [paper['paperId'] for paper in data['data'] if 'paperId' in paper]
+            logger.info(f"Found {len(paper_ids)} papers")
+
+            return paper_ids
+
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return []
+
+    @staticmethod
+    def _search_params(
+        query: str,
+        limit: int,
+        year: Optional[str],
+        fields_of_study: Optional[List[str]],
+        open_access_only: bool,
+        fields: str = 'paperId'
+    ) -> Dict:
+        """Build query parameters for the /paper/search endpoint."""
         params = {
             'query': query,
-            'limit': min(max_results, 100),
-            'fields': 'paperId'
+            'limit': limit,
+            'fields': fields
         }
 
         if year:
@@ -125,24 +159,121 @@ class SemanticScholarClient(BaseLiteratureClient):
         if open_access_only:
             params['openAccessPdf'] = ''
 
-        try:
-            logger.info(f"Searching Semantic Scholar: '{query}' (max={max_results})")
+        return params
+
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = 25,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        open_access_only: bool = False,
+        max_results: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Stream papers matching query using offset pagination.
+
+        Each page request returns full paper details, and the next page is
+        only requested once the current one is exhausted. Results are not
+        cached.
+
+        Args:
+            query: Search query
+            page_size: Number of paper IDs per search request (max 100)
+            year: Filter by year (e.g., "2020" or "2020-2023")
+            fields_of_study: Filter by fields (e.g., ["Medicine", "Biology"])
+            open_access_only: Only return open access papers
+            max_results: Stop after this many papers (None for no limit)
 
+        Yields:
+            Article dictionaries
+        """
+        params = self._search_params(
+            query, min(page_size, 100), year, fields_of_study, open_access_only,
+            fields=self.PAPER_FIELDS
+        )
+        offset = 0
+        seen = 0
+
+        while max_results is None or seen < max_results:
+            params['offset'] = offset
+            if max_results is not None:
+                params['limit'] = min(page_size, 100, max_results - seen)
             data = self._make_request('/paper/search', params)
 
-            if not data or 'data' not in data:
-                logger.warning("No results returned")
-                return []
+            if not data or not data.get('data'):
+                return
+
+            for paper in data['data']:
+                if max_results is not None and seen >= max_results:
+                    return
+                seen += 1
+                yield self._parse_paper(paper).to_dict()
+
+            # 'next' is only present while more results are available
+            if 'next' not in data:
+                return
+            offset = data['next']
+
+    @staticmethod
+    def _parse_paper(data: Dict) -> Article:
+        """Convert a Semantic Scholar paper record into an Article."""
+        return Article(
+            id=data.get('paperId', ''),
+            title=data.get('title', ''),
+            abstract=data.get('abstract', ''),
+            authors=[author.get('name', '') for author in data.get('authors', [])],
+            journal=data.get('journal', {}).get('name', '') if data.get('journal') else '',
+            pub_date=str(data.get('year', '')),
+            doi=(data.get('externalIds') or {}).get('DOI', ''),
+            url=data.get('url', ''),
+            source='semantic_scholar',
+            citation_count=data.get('citationCount', 0),
+            pdf_url=data.get('openAccessPdf', {}).get('url', '') if data.get('openAccessPdf') else '',
+            open_access=bool(data.get('openAccessPdf'))
+        )
+
+    def _search_articles(
+        self,
+        query: str,
+        max_results: int = 10,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        open_access_only: bool = False,
+        **kwargs
+    ) -> List[Article]:
+        """
+        Search and fetch details in a single /paper/search request.
 
-            paper_ids = [paper['paperId'] for paper in data['data'] if 'paperId' in paper]
-            logger.info(f"Found {len(paper_ids)} papers")
+        Asking the search endpoint for the detail fields avoids one
+        /paper/{id} round trip per result.
 
-            return paper_ids
+        Returns:
+            List of Article objects
+        """
+        params = self._search_params(
+            query, min(max_results, 100), year, fields_of_study, open_access_only,
+            fields=self.PAPER_FIELDS
+        )
 
-        except Exception as e:
-            logger.error(f"Search failed: {e}")
+        logger.info(f"Searching Semantic Scholar: '{query}' (max={max_results})")
+        data = self._make_request('/paper/search', params)
+
+        if not data or 'data' not in data:
+            logger.warning("No results returned")
             return []
 
+        articles = []
+        for paper in data['data']:
+            try:
+                articles.append(self._parse_paper(paper))
+            except Exception as e:
+                logger.warning(f"Failed to parse paper {paper.get('paperId')}: {e}")
+
+        logger.info(f"Found {len(articles)} papers")
+        return articles
+
     def fetch_details(self, ids: List[str]) -> List[Article]:
         """
         Fetch detailed information for papers.
@@ -157,31 +288,17 @@ class SemanticScholarClient(BaseLiteratureClient):
             return []
 
         articles = []
-        fields = 'paperId,title,abstract,authors,year,journal,citationCount,openAccessPdf,externalIds,url'
 
         for paper_id in ids:
             try:
-                data = self._make_request(f'/paper/{paper_id}', {'fields': fields})
+                data = self._make_request(
+                    f'/paper/{paper_id}', {'fields': self.PAPER_FIELDS}
+                )
 
                 if not data:
                     continue
 
-                # Extract data
-                article = Article(
-                    id=data.get('paperId', ''),
-                    title=data.get('title', ''),
-                    abstract=data.get('abstract', ''),
-                    authors=[author.get('name', '') for author in data.get('authors', [])],
-                    journal=data.get('journal', {}).get('name', '') if data.get('journal') else '',
-                    pub_date=str(data.get('year', '')),
-                    doi=data.get('externalIds', {}).get('DOI', ''),
-                    url=data.get('url', ''),
-                    source='semantic_scholar',
-                    citation_count=data.get('citationCount', 0),
-                    pdf_url=data.get('openAccessPdf', {}).get('url', '') if data.get('openAccessPdf') else '',
-                    open_access=bool(data.get('openAccessPdf'))
-                )
-
+                article = self._parse_paper(data)
                 articles.append(article)
 
             except Exception as e:
@@ -213,20 +330,8 @@ class SemanticScholarClient(BaseLiteratureClient):
             if not data:
                 return None
 
-            article = Article(
-                id=data.get('paperId', ''),
-                title=data.get('title', ''),
-                abstract=data.get('abstract', ''),
-                authors=[author.get('name', '') for author in data.get('authors', [])],
-                journal=data.get('journal', {}).get('name', '') if data.get('journal') else '',
-                pub_date=str(data.get('year', '')),
-                doi=doi,
-                url=data.get('url', ''),
-                source='semantic_scholar',
-                citation_count=data.get('citationCount', 0),
-                pdf_url=data.get('openAccessPdf', {}).get('url', '') if data.get('openAccessPdf') else '',
-                open_access=bool(data.get('openAccessPdf'))
-            )
+            article = self._parse_paper(data)
+            article.doi = doi
 
             return article.to_dict()
 
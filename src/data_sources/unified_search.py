@@ -3,7 +3,7 @@ Unified search interface for multiple literature databases.
 
 Allows searching across PubMed, Semantic Scholar, and Europe PMC simultaneously.
 """
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -162,6 +162,50 @@ class UnifiedSearchClient:
 
         return results
 
+    def iter_search_all(
+        self,
+        query: str,
+        page_size: int = 25,
+        **kwargs
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream articles from all available sources.
+
+        Sources are interleaved round-robin, so capping the stream (e.g.
+        with itertools.islice) draws evenly from each one. A source that
+        fails is dropped and the others carry on.
+
+        Args:
+            query: Search query
+            page_size: Page size requested from each source
+            **kwargs: Additional source-specific parameters
+
+        Yields:
+            (source name, article dictionary) pairs
+        """
+        streams = {}
+        for source, client in self.clients.items():
+            try:
+                streams[source] = iter(
+                    client.iter_search(query, page_size=page_size, **kwargs)
+                )
+            except Exception as e:
+                logger.error(f"Streaming search failed for {source}: {e}")
+
+        while streams:
+            for source, stream in list(streams.items()):
+                try:
+                    article = next(stream)
+                except StopIteration:
+                    del streams[source]
+                    continue
+                except Exception as e:
+                    logger.error(f"Streaming search failed for {source}: {e}")
+                    del streams[source]
+                    continue
+
+                yield source, article
+
     def search_and_merge(
         self,
         query: str,
@@ -190,6 +234,32 @@ class UnifiedSearchClient:
             query, max_results_per_source, parallel=True, **kwargs
         )
 
+        return self.merge_results(
+            all_results,
+            total_max_results=total_max_results,
+            deduplicate=deduplicate,
+            sort_by=sort_by
+        )
+
+    def merge_results(
+        self,
+        all_results: Dict[str, List[Dict]],
+        total_max_results: Optional[int] = None,
+        deduplicate: bool = True,
+        sort_by: str = "citation_count"
+    ) -> List[Dict]:
+        """
+        Merge per-source results into one sorted list.
+
+        Args:
+            all_results: Results from search_all_sources()
+            total_max_results: Maximum total results after merging
+            deduplicate: Remove duplicate articles (by DOI and title)
+            sort_by: Sort merged results by field
+
+        Returns:
+            Merged and sorted list of articles
+        """
         # Merge results
         merged = []
         for source, articles in all_results.items():
@@ -291,27 +361,50 @@ class UnifiedSearchClient:
         Returns:
             Dictionary with statistics
         """
+        return self.reduce_stats(
+            (
+                (source, article)
+                for source, articles in results.items()
+                for article in articles
+            ),
+            sources=results.keys()
+        )
+
+    @staticmethod
+    def reduce_stats(
+        articles: Iterable[Tuple[str, Dict]],
+        sources: Iterable[str] = ()
+    ) -> Dict:
+        """
+        Fold statistics over a stream of articles in constant memory.
+
+        Args:
+            articles: (source name, article) pairs, e.g. from iter_search_all()
+            sources: Sources to report even if they yield no articles
+
+        Returns:
+            Dictionary with statistics (same shape as get_statistics())
+        """
         stats = {
             'total_articles': 0,
-            'by_source': {},
+            'by_source': dict.fromkeys(sources, 0),
             'open_access_count': 0,
             'with_pdf_count': 0,
             'avg_citation_count': 0
         }
 
+        by_source = stats['by_source']
         total_citations = 0
 
-        for source, articles in results.items():
-            count = len(articles)
-            stats['by_source'][source] = count
-            stats['total_articles'] += count
-
-            for article in articles:
-                if article.get('open_access'):
-                    stats['open_access_count'] += 1
-                if article.get('pdf_url'):
-                    stats['with_pdf_count'] += 1
-                total_citations += article.get('citation_count', 0)
+        for source, article in articles:
+            by_source[source] = by_source.get(source, 0) + 1
+            stats['total_articles'] += 1
+
+            if article.get('open_access'):
+                stats['open_access_count'] += 1
+            if article.get('pdf_url'):
+                stats['with_pdf_count'] += 1
+            total_citations += article.get('citation_count', 0)
 
         if stats['total_articles'] > 0:
             stats['avg_citation_count'] = total_citations / stats['total_articles']
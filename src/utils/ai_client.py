@@ -9,20 +9,63 @@ Improvements:
 - Improved logging for debugging
 - Added response metadata tracking
 """
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, NamedTuple
 import os
 import logging
+import hashlib
+import threading
+import time
+import importlib.util
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+__all__ = ["AIResponse", "BaseAIClient", "ClaudeClient", "KimiClient", "QwenClient", "AIClientManager"]
+
+# Logging is configured by the application (see src/utils/logger.py).
+# Pass values as %-style arguments so messages are only formatted when the
+# level is enabled; wrap anything expensive to compute in
+# ``if logger.isEnabledFor(logging.INFO):``.
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Provider SDKs are imported on first use and cached process-wide, so a
+# session that only talks to one provider never loads the other SDKs.
+@lru_cache(maxsize=1)
+def _anthropic():
+    """Import and return the Anthropic SDK module."""
+    import anthropic
+    return anthropic
+
+
+@lru_cache(maxsize=1)
+def _openai_class():
+    """Import and return the OpenAI client class (used by Kimi)."""
+    from openai import OpenAI
+    return OpenAI
+
+
+@lru_cache(maxsize=1)
+def _dashscope():
+    """Import and return the DashScope SDK module (used by Qwen)."""
+    import dashscope
+    return dashscope
+
+
+def _require_sdk(module_name: str) -> None:
+    """Raise ImportError if an SDK is not installed, without importing it."""
+    if importlib.util.find_spec(module_name) is None:
+        raise ImportError(f"No module named '{module_name}'")
+
+
+@dataclass(frozen=True, slots=True)
 class AIResponse:
-    """Structured AI response with metadata."""
+    """
+    Structured AI response with metadata.
+
+    Instances are immutable: cache hits return the same shared instance.
+    """
     content: str
     prompt_tokens: int
     completion_tokens: int
@@ -30,6 +73,8 @@ class AIResponse:
     model: str
     provider: str
     error: Optional[str] = None
+    cached_tokens: int = 0  # Prompt tokens served from the provider's prompt cache
+    cache_write_tokens: int = 0  # Prompt tokens written to the provider's prompt cache
 
 
 class BaseAIClient(ABC):
@@ -79,12 +124,23 @@ class BaseAIClient(ABC):
 class ClaudeClient(BaseAIClient):
     """Anthropic Claude client with enhanced error handling and token tracking."""
 
+    # Anthropic only caches prompt prefixes of at least ~1024 tokens
+    PROMPT_CACHE_MIN_TOKENS = 1024
+
     def __init__(self, api_key: str):
-        import anthropic
-        self.client = anthropic.Anthropic(api_key=api_key)
+        _require_sdk("anthropic")
+        self._api_key = api_key
+        self._client = None
         self.model = "claude-3-5-sonnet-20241022"
         self.provider = "claude"
 
+    @property
+    def client(self):
+        """Anthropic SDK client, created on first use."""
+        if self._client is None:
+            self._client = _anthropic().Anthropic(api_key=self._api_key)
+        return self._client
+
     def generate(
         self,
         prompt: str,
@@ -92,8 +148,22 @@ class ClaudeClient(BaseAIClient):
         max_tokens: int = 1024,
         temperature: float = 0.7
     ) -> AIResponse:
-        """Generate response using Claude with full metadata."""
-        messages = [{"role": "user", "content": prompt}]
+        """
+        Generate response using Claude with full metadata.
+
+        The system prompt, and the user prompt when it is long enough to be
+        cacheable, are marked with ``cache_control`` so repeated calls sharing
+        the same prefix are billed at the prompt-cache rate.
+        """
+        if self._estimate_tokens(prompt) >= self.PROMPT_CACHE_MIN_TOKENS:
+            content_blocks = [{
+                "type": "text",
+                "text": prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+            messages = [{"role": "user", "content": content_blocks}]
+        else:
+            messages = [{"role": "user", "content": prompt}]
 
         kwargs = {
             "model": self.model,
@@ -103,7 +173,11 @@ class ClaudeClient(BaseAIClient):
         }
 
         if system_prompt:
-            kwargs["system"] = system_prompt
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
 
         try:
             response = self.client.messages.create(**kwargs)
@@ -112,15 +186,27 @@ class ClaudeClient(BaseAIClient):
             usage = response.usage
             content = response.content[0].text
 
-            logger.info(f"Claude API call successful: {usage.input_tokens} input, {usage.output_tokens} output tokens")
+            # input_tokens excludes the prompt-cache reads and writes, which
+            # are reported (and billed at their own rates) separately
+            cached_tokens = getattr(usage, "cache_read_input_tokens", 0) or 0
+            cache_write_tokens = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            prompt_tokens = usage.input_tokens + cached_tokens + cache_write_tokens
+
+            logger.info(
+                "Claude API call successful: %d input (%d cache read, %d cache write), "
+                "%d output tokens",
+                prompt_tokens, cached_tokens, cache_write_tokens, usage.output_tokens
+            )
 
             return AIResponse(
                 content=content,
-                prompt_tokens=usage.input_tokens,
+                prompt_tokens=prompt_tokens,
                 completion_tokens=usage.output_tokens,
-                total_tokens=usage.input_tokens + usage.output_tokens,
+                total_tokens=prompt_tokens + usage.output_tokens,
                 model=self.model,
-                provider=self.provider
+                provider=self.provider,
+                cached_tokens=cached_tokens,
+                cache_write_tokens=cache_write_tokens
             )
         except Exception as e:
             error_msg = f"Claude API Error: {str(e)}"
@@ -151,14 +237,22 @@ class KimiClient(BaseAIClient):
     """Moonshot AI (Kimi) client using OpenAI-compatible API with enhanced tracking."""
 
     def __init__(self, api_key: str):
-        from openai import OpenAI
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.moonshot.cn/v1"
-        )
+        _require_sdk("openai")
+        self._api_key = api_key
+        self._client = None
         self.model = "moonshot-v1-8k"
         self.provider = "kimi"
 
+    @property
+    def client(self):
+        """OpenAI-compatible client for the Moonshot API, created on first use."""
+        if self._client is None:
+            self._client = _openai_class()(
+                api_key=self._api_key,
+                base_url="https://api.moonshot.cn/v1"
+            )
+        return self._client
+
     def generate(
         self,
         prompt: str,
@@ -185,7 +279,10 @@ class KimiClient(BaseAIClient):
             content = response.choices[0].message.content
             usage = response.usage
 
-            logger.info(f"Kimi API call successful: {usage.prompt_tokens} input, {usage.completion_tokens} output tokens")
+            logger.info(
+                "Kimi API call successful: %d input, %d output tokens",
+                usage.prompt_tokens, usage.completion_tokens
+            )
 
             return AIResponse(
                 content=content,
@@ -224,11 +321,20 @@ class QwenClient(BaseAIClient):
     """Alibaba Cloud Qwen (通义千问) client with enhanced tracking."""
 
     def __init__(self, api_key: str):
-        import dashscope
-        dashscope.api_key = api_key
+        _require_sdk("dashscope")
+        self._api_key = api_key
+        self._generation = None
         self.model = "qwen-turbo"
         self.provider = "qwen"
 
+    def _get_generation(self):
+        """DashScope ``Generation`` API, configured with the key on first use."""
+        if self._generation is None:
+            dashscope = _dashscope()
+            dashscope.api_key = self._api_key
+            self._generation = dashscope.Generation
+        return self._generation
+
     def generate(
         self,
         prompt: str,
@@ -237,8 +343,6 @@ class QwenClient(BaseAIClient):
         temperature: float = 0.7
     ) -> AIResponse:
         """Generate response using Qwen with full metadata."""
-        from dashscope import Generation
-
         messages = []
 
         if system_prompt:
@@ -247,7 +351,7 @@ class QwenClient(BaseAIClient):
         messages.append({"role": "user", "content": prompt})
 
         try:
-            response = Generation.call(
+            response = self._get_generation().call(
                 model=self.model,
                 messages=messages,
                 max_tokens=max_tokens,
@@ -263,7 +367,10 @@ class QwenClient(BaseAIClient):
                 prompt_tokens = usage.get('input_tokens', self._estimate_tokens(prompt + (system_prompt or "")))
                 completion_tokens = usage.get('output_tokens', self._estimate_tokens(content))
 
-                logger.info(f"Qwen API call successful: {prompt_tokens} input, {completion_tokens} output tokens")
+                logger.info(
+                    "Qwen API call successful: %d input, %d output tokens",
+                    prompt_tokens, completion_tokens
+                )
 
                 return AIResponse(
                     content=content,
@@ -313,6 +420,12 @@ class QwenClient(BaseAIClient):
         }
 
 
+class ResolvedProvider(NamedTuple):
+    """Normalized provider name and its client (None if unavailable)."""
+    name: str
+    client: Optional[BaseAIClient]
+
+
 class AIClientManager:
     """Manager for multiple AI providers."""
 
@@ -321,6 +434,10 @@ class AIClientManager:
         "kimi": KimiClient,
         "qwen": QwenClient
     }
+    _SUPPORTED = frozenset(SUPPORTED_PROVIDERS)
+
+    # Maximum number of responses kept in the in-process (L1) cache
+    L1_CACHE_SIZE = 2048
 
     def __init__(self, enable_cache: bool = True):
         """
@@ -333,19 +450,42 @@ class AIClientManager:
         self.enable_cache = enable_cache
         self._cache_manager = None
 
+        # In-process LRU (L1) in front of the disk cache (L2):
+        # key -> (response, expire time of the L2 entry)
+        self._l1: "OrderedDict[str, Tuple[AIResponse, Optional[float]]]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+        self._cache_counts = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+        # Per-thread outcome of the most recent request (see last_was_hit)
+        self._last_request = threading.local()
+
         # Lazy load cache manager if enabled
         if self.enable_cache:
             try:
                 from src.utils.cache_manager import get_cache_manager
                 self._cache_manager = get_cache_manager()
+                # Drop L1 entries when the disk cache evicts or clears them
+                self._cache_manager.add_ai_invalidation_listener(self._l1_invalidate)
             except Exception:
                 # Graceful fallback if cache not available
                 self.enable_cache = False
 
+        # Resolved once; call refresh_env() after changing the environment
+        self._default_provider = os.getenv("DEFAULT_AI_PROVIDER", "claude").lower()
+
+        self._initialize_clients()
+
+    def refresh_env(self):
+        """Re-read provider environment variables (API keys, default provider)."""
+        self._default_provider = os.getenv("DEFAULT_AI_PROVIDER", "claude").lower()
+        self.clients = {}
         self._initialize_clients()
 
     def _initialize_clients(self):
-        """Initialize all available AI clients based on environment variables."""
+        """
+        Initialize all available AI clients based on environment variables.
+
+        Clients are stored under lowercase provider names.
+        """
         # Claude
         if os.getenv("ANTHROPIC_API_KEY"):
             try:
@@ -383,15 +523,93 @@ class AIClientManager:
         Returns:
             AI client instance or None if not available
         """
-        if provider is None:
-            provider = os.getenv("DEFAULT_AI_PROVIDER", "claude")
+        return self._resolve(provider).client
 
-        return self.clients.get(provider.lower())
+    def _resolve(self, provider: Optional[str]) -> ResolvedProvider:
+        """Normalize a provider name (None means default) and look up its client."""
+        name = (provider or self._default_provider).lower()
+        if name not in self._SUPPORTED:
+            return ResolvedProvider(name, None)
+        return ResolvedProvider(name, self.clients.get(name))
 
     def get_available_providers(self) -> List[str]:
         """Get list of available AI providers."""
         return list(self.clients.keys())
 
+    @staticmethod
+    def _l1_key(
+        prompt: str,
+        provider: str,
+        model: str,
+        system_prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Build the in-process cache key for a request."""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (provider, model, system_prompt, str(max_tokens), str(temperature), prompt):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def _l1_get(self, key: str) -> Optional[AIResponse]:
+        """Get an unexpired response from the in-process cache, refreshing its recency."""
+        with self._l1_lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
+
+            value, expire_time = entry
+            if expire_time is not None and expire_time <= time.time():
+                # The L2 entry has expired too; don't outlive it
+                del self._l1[key]
+                return None
+
+            self._l1.move_to_end(key)
+            return value
+
+    def _l1_set(self, key: str, value: AIResponse, expire_time: Optional[float]) -> None:
+        """Store a response in the in-process cache, evicting the oldest entry."""
+        with self._l1_lock:
+            self._l1[key] = (value, expire_time)
+            self._l1.move_to_end(key)
+            if len(self._l1) > self.L1_CACHE_SIZE:
+                self._l1.popitem(last=False)
+
+    def _l1_invalidate(self, keys: Optional[List[str]]) -> None:
+        """Drop keys the disk cache no longer holds (None drops everything)."""
+        with self._l1_lock:
+            if keys is None:
+                self._l1.clear()
+            else:
+                for key in keys:
+                    self._l1.pop(key, None)
+
+    def _count_cache(self, outcome: str) -> None:
+        """Increment a cache outcome counter (l1_hits, l2_hits, misses)."""
+        with self._l1_lock:
+            self._cache_counts[outcome] += 1
+        self._last_request.hit = outcome != "misses"
+
+    def last_was_hit(self) -> bool:
+        """
+        Whether the calling thread's most recent request was served from cache.
+
+        Returns:
+            True for an L1 or L2 hit, False for a miss or an uncached request
+        """
+        return getattr(self._last_request, "hit", False)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get response cache statistics for this manager.
+
+        Returns:
+            Dictionary with l1_hits, l2_hits, misses and l1_size
+        """
+        with self._l1_lock:
+            return {**self._cache_counts, "l1_size": len(self._l1)}
+
     def generate(
         self,
         prompt: str,
@@ -456,12 +674,10 @@ class AIClientManager:
         """
         # Determine cache usage
         should_cache = self.enable_cache if use_cache is None else use_cache
+        self._last_request.hit = False
 
         # Get provider info
-        if provider is None:
-            provider = os.getenv("DEFAULT_AI_PROVIDER", "claude")
-
-        client = self.get_client(provider)
+        provider, client = self._resolve(provider)
 
         if client is None:
             available = ", ".join(self.get_available_providers())
@@ -477,31 +693,54 @@ class AIClientManager:
                 error=error_msg
             )
 
-        # Check cache if enabled
-        if should_cache and self._cache_manager:
-            cached_response = self._cache_manager.get_ai_response(
-                prompt=prompt,
-                provider=provider,
-                model=client.model,
-                system_prompt=system_prompt or "",
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
-
-            if cached_response:
-                logger.info(f"Cache hit for {provider} request")
-                # Return cached content as AIResponse (without token tracking)
-                return AIResponse(
-                    content=cached_response,
-                    prompt_tokens=0,
-                    completion_tokens=0,
-                    total_tokens=0,
+        # Check cache if enabled: in-process L1 first, then the disk cache.
+        # The key is computed once and reused for both tiers and the store.
+        if should_cache:
+            if self._cache_manager:
+                l1_key = self._cache_manager.make_ai_key(
+                    prompt=prompt,
+                    provider=provider,
                     model=client.model,
-                    provider=provider
+                    system_prompt=system_prompt or "",
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            else:
+                l1_key = self._l1_key(
+                    prompt, provider, client.model,
+                    system_prompt or "", max_tokens, temperature
                 )
+            cached = self._l1_get(l1_key)
+
+            if cached is not None:
+                self._count_cache("l1_hits")
+                if self._cache_manager:
+                    # Keep the disk cache's LRU-2 history aware of this hit
+                    self._cache_manager.touch(l1_key)
+                logger.info("Cache hit for %s request", provider)
+                return cached
+
+            if self._cache_manager:
+                cached_content, expire_time = self._cache_manager.get_ai_response_entry(l1_key)
+                if cached_content:
+                    self._count_cache("l2_hits")
+                    logger.info("Cache hit for %s request", provider)
+                    # Cached responses carry no token usage (nothing was billed)
+                    cached = AIResponse(
+                        content=cached_content,
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        total_tokens=0,
+                        model=client.model,
+                        provider=provider
+                    )
+                    self._l1_set(l1_key, cached, expire_time)
+                    return cached
+
+            self._count_cache("misses")
 
         # Generate new response
-        logger.info(f"Generating new response with {provider}")
+        logger.info("Generating new response with %s", provider)
         ai_response = client.generate(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -509,17 +748,25 @@ class AIClientManager:
             temperature=temperature
         )
 
-        # Cache response if enabled and valid (no error)
-        if should_cache and self._cache_manager and ai_response.error is None:
-            self._cache_manager.set_ai_response(
-                prompt=prompt,
-                provider=provider,
-                model=client.model,
-                response=ai_response.content,
-                system_prompt=system_prompt or "",
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
+        # Cache response if enabled and valid (no error). The shared L1
+        # instance lives exactly as long as the disk entry, so it is only
+        # kept if the disk write succeeded.
+        if should_cache and ai_response.error is None:
+            expire_time = None
+            if self._cache_manager:
+                expire_time = self._cache_manager.set_ai_response_by_key(
+                    l1_key, ai_response.content
+                )
+
+            if expire_time is not None or not self._cache_manager:
+                self._l1_set(l1_key, replace(
+                    ai_response,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    total_tokens=0,
+                    cached_tokens=0,
+                    cache_write_tokens=0
+                ), expire_time)
 
         # Track cost if enabled and no error
         if track_cost and ai_response.error is None:
@@ -531,17 +778,19 @@ class AIClientManager:
                     model=ai_response.model,
                     prompt_tokens=ai_response.prompt_tokens,
                     completion_tokens=ai_response.completion_tokens,
-                    operation="generate"
+                    operation="generate",
+                    cached_tokens=ai_response.cached_tokens,
+                    cache_write_tokens=ai_response.cache_write_tokens
                 )
-                logger.info(f"Cost tracked: ${cost:.4f}")
+                logger.info("Cost tracked: $%.4f", cost)
             except Exception as e:
-                logger.warning(f"Failed to track cost: {e}")
+                logger.warning("Failed to track cost: %s", e)
 
         return ai_response
 
     def get_provider_info(self, provider: Optional[str] = None) -> Dict[str, str]:
         """Get information about a provider."""
-        client = self.get_client(provider)
+        client = self._resolve(provider).client
         if client:
             return client.get_model_info()
         return {"error": "Provider not available"}
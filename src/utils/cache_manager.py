@@ -8,20 +8,277 @@ Improvements:
 - Improved error handling
 - Added cache statistics and monitoring
 - Added LRU eviction policy
+- Added in-memory LRU tier in front of the disk caches
+- Added zstd compression for large AI responses
+- Added scan-resistant LRU-2 eviction for AI responses
+- Stored PubMed results as msgpack instead of pickle
 """
+import atexit
 import hashlib
-import json
 import os
 import logging
-from typing import Optional, Any, Dict
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Any, Callable, Dict, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-import diskcache
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .json_utils import dumps as json_dumps
+
 logger = logging.getLogger(__name__)
 
+try:
+    import zstandard
+except ImportError:  # Optional: AI responses are stored uncompressed
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: PubMed results are pickled by diskcache
+    msgpack = None
+
+# Frame magic number written at the start of every zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Thread-local zstd (de)compressor contexts, reused across calls
+_zstd_local = threading.local()
+
+
+def _compress_response(response: str) -> bytes:
+    """
+    Encode a response for storage as UTF-8 bytes.
+
+    diskcache stores bytes as a BLOB without pickling. Large responses are
+    additionally zstd-compressed.
+    """
+    data = response.encode("utf-8")
+    if zstandard is None or len(data) < CacheManager.COMPRESS_MIN_SIZE:
+        return data
+
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(data)
+
+
+def _decompress_response(raw: Any) -> Any:
+    """Inverse of _compress_response; returns None if the frame can't be read."""
+    if not isinstance(raw, bytes):
+        # Entries written before responses were stored as bytes
+        return raw
+
+    if raw.startswith(ZSTD_MAGIC):
+        # Never valid UTF-8 (0xB5 can't follow '('), so no ambiguity with text
+        if zstandard is None:
+            logger.warning("Cached AI response is zstd-compressed but zstandard is not installed")
+            return None
+
+        decompressor = getattr(_zstd_local, "decompressor", None)
+        if decompressor is None:
+            decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+        raw = decompressor.decompress(raw)
+
+    return raw.decode("utf-8")
+
+
+def _pack_results(results: list) -> Any:
+    """
+    Serialize PubMed results with msgpack for storage.
+
+    Falls back to the list itself (pickled by diskcache) when msgpack is not
+    installed or the results hold types msgpack can't round-trip exactly.
+    ``strict_types`` makes tuples and other list/dict/str subclasses raise
+    instead of silently coming back as their base type.
+    """
+    if msgpack is None:
+        return results
+    try:
+        return msgpack.packb(results, use_bin_type=True, strict_types=True)
+    except (TypeError, ValueError, OverflowError):
+        return results
+
+
+def _unpack_results(raw: Any) -> Any:
+    """Inverse of _pack_results; returns None if the payload can't be read."""
+    if not isinstance(raw, bytes):
+        return raw
+
+    if msgpack is None:
+        logger.warning("Cached PubMed results are msgpack-encoded but msgpack is not installed")
+        return None
+    try:
+        # Non-str map keys (e.g. ints) are valid in stored results
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    except Exception as e:
+        logger.warning(f"Failed to decode cached PubMed results: {e}")
+        return None
+
+
+class LRU2Evictor:
+    """
+    Scan-resistant LRU-2 eviction for a diskcache.Cache.
+
+    Tracks the last two access times of every key in a sidecar SQLite table
+    and evicts keys whose second-to-last access is oldest. Keys accessed only
+    once (e.g. by a large one-off batch) have no second access and are
+    evicted first, so a burst of new entries cannot flush entries that are
+    reused. Access times are buffered in memory and written in bulk when
+    maybe_evict() runs.
+    """
+
+    def __init__(
+        self,
+        cache: "diskcache.Cache",
+        db_path: Path,
+        check_every: int = 100,
+        target_ratio: float = 0.9,
+        on_evict: Optional[Callable[[List[str]], None]] = None
+    ):
+        """
+        Initialize evictor.
+
+        Args:
+            cache: Cache to evict from (its eviction_policy should be 'none')
+            db_path: Path of the sidecar SQLite database
+            check_every: Check the cache size every N writes
+            target_ratio: Evict down to this fraction of the size limit
+            on_evict: Called with the evicted keys after each eviction
+        """
+        self.cache = cache
+        self.check_every = check_every
+        self.target_ratio = target_ratio
+        self.on_evict = on_evict
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        # key -> [reset_history, newest access time, previous access time]
+        self._pending: Dict[str, List[Any]] = {}
+
+        self._con = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS lru2(key TEXT PRIMARY KEY, t1 REAL, t2 REAL)"
+        )
+        self._con.commit()
+
+    def record_access(self, key: str) -> None:
+        """Record a cache hit for key."""
+        now = time.time()
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = [False, now, None]
+            else:
+                entry[1], entry[2] = now, entry[1]
+
+    def record_write(self, key: str) -> bool:
+        """
+        Record a write of key, which starts a fresh access history.
+
+        Returns:
+            True when a size check is due (call maybe_evict())
+        """
+        with self._lock:
+            self._pending[key] = [True, time.time(), None]
+            self._writes += 1
+            return self._writes % self.check_every == 0
+
+    def flush(self) -> None:
+        """Write buffered access times to the sidecar table."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            resets = [(k, t1, t2) for k, (reset, t1, t2) in pending.items() if reset]
+            hits = [(k, t1, t2) for k, (reset, t1, t2) in pending.items() if not reset]
+
+            with self._con:
+                self._con.executemany(
+                    "INSERT OR REPLACE INTO lru2(key, t1, t2) VALUES (?, ?, ?)",
+                    resets
+                )
+                # A single new hit shifts the stored t1 into t2
+                self._con.executemany(
+                    "INSERT INTO lru2(key, t1, t2) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET "
+                    "t2 = COALESCE(excluded.t2, lru2.t1), t1 = excluded.t1",
+                    hits
+                )
+
+    def maybe_evict(self) -> int:
+        """
+        Evict entries if the cache is over its size limit.
+
+        Returns:
+            Number of entries evicted
+        """
+        self.flush()
+
+        if self.cache.volume() <= self.cache.size_limit:
+            return 0
+
+        target = self.cache.size_limit * self.target_ratio
+
+        with self._lock:
+            history = {
+                key: (t2, t1)
+                for key, t1, t2 in self._con.execute("SELECT key, t1, t2 FROM lru2")
+            }
+
+        # Untracked keys and keys seen once sort first, then oldest t2
+        def rank(key):
+            t2, t1 = history.get(key, (None, None))
+            return (t2 is not None, t2 or 0.0, t1 or 0.0)
+
+        candidates = sorted(self.cache.iterkeys(), key=rank)
+
+        # Drop history rows for keys that expired or were deleted elsewhere
+        stale = history.keys() - set(candidates)
+
+        evicted = []
+        for key in candidates:
+            if len(evicted) % 16 == 0 and self.cache.volume() <= target:
+                break
+            if self.cache.delete(key):
+                evicted.append(key)
+
+        with self._lock, self._con:
+            self._con.executemany(
+                "DELETE FROM lru2 WHERE key = ?",
+                [(k,) for k in (*evicted, *stale)]
+            )
+
+        if evicted:
+            logger.info(f"LRU-2 eviction removed {len(evicted)} AI cache entries")
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+        return len(evicted)
+
+    def discard(self, key: str) -> None:
+        """Forget a key (e.g. after it was deleted from the cache)."""
+        with self._lock:
+            self._pending.pop(key, None)
+            with self._con:
+                self._con.execute("DELETE FROM lru2 WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        with self._lock:
+            self._pending.clear()
+            with self._con:
+                self._con.execute("DELETE FROM lru2")
+
+    def close(self) -> None:
+        """Flush buffered access times and close the sidecar database."""
+        self.flush()
+        with self._lock:
+            self._con.close()
+
 
 class CacheManager:
     """Manages caching for AI responses and PubMed queries with size limits and auto-cleanup."""
@@ -29,6 +286,30 @@ class CacheManager:
     # Default cache size limit: 500MB per cache
     DEFAULT_SIZE_LIMIT = 500 * 1024 * 1024
 
+    # Entries kept in each in-memory tier
+    MEMORY_CACHE_SIZE = 1024
+
+    # Max distinct (provider, model, system prompt) key prefixes kept
+    AI_KEY_PREFIX_LIMIT = 256
+
+    # Generation parameters passed on every AIClientManager request; hashed
+    # positionally instead of by name with the other keyword arguments
+    AI_KEY_FIELDS = ("max_tokens", "temperature")
+
+    # AI responses at least this long (in UTF-8 bytes) are zstd-compressed
+    COMPRESS_MIN_SIZE = 1024
+
+    # Seconds for which get_cache_stats() results are reused
+    STATS_TTL = 5.0
+
+    # SQLite tuning: WAL journal, synchronous=NORMAL (losing the last few
+    # writes on a crash is acceptable for a cache) and 64MB mmap reads
+    SQLITE_SETTINGS = {
+        'sqlite_journal_mode': 'wal',
+        'sqlite_synchronous': 1,
+        'sqlite_mmap_size': 64 * 1024 * 1024
+    }
+
     def __init__(
         self,
         cache_dir: str = "./cache",
@@ -43,28 +324,80 @@ class CacheManager:
             expiry_days: Number of days before cache expires
             size_limit: Maximum size per cache in bytes (default: 500MB)
         """
+        # Imported here so that importing this module stays cheap
+        import diskcache
+
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
 
         # Separate caches for different purposes with size limits
+        # AI responses are evicted by LRU-2 (see LRU2Evictor), not diskcache
         self.ai_cache = diskcache.Cache(
             str(self.cache_dir / "ai_responses"),
             size_limit=size_limit,
-            eviction_policy='least-recently-used'
+            eviction_policy='none',
+            **self.SQLITE_SETTINGS
         )
         self.pubmed_cache = diskcache.Cache(
             str(self.cache_dir / "pubmed_queries"),
             size_limit=size_limit,
-            eviction_policy='least-recently-used'
+            eviction_policy='least-recently-used',
+            **self.SQLITE_SETTINGS
+        )
+
+        self.ai_evictor = LRU2Evictor(
+            self.ai_cache,
+            self.cache_dir / "ai_responses_lru2.db",
+            on_evict=self._forget_ai_keys
         )
 
         self.expiry_seconds = expiry_days * 24 * 3600
 
-        # Perform initial cleanup
-        self._initial_cleanup()
+        # In-memory LRU tiers: key -> (value, expire_time)
+        self._mem_ai: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        # Bound methods told which AI keys were dropped (None means all)
+        self._ai_listeners: List[weakref.WeakMethod] = []
+        self._mem_pubmed: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._mem_max = self.MEMORY_CACHE_SIZE
+        self._mem_lock = threading.Lock()
+
+        # Partially-fed AI key hashes per (provider, model, system prompt);
+        # see _generate_ai_key
+        self._ai_key_prefixes: Dict[Tuple[str, str, Optional[str]], Any] = {}
+
+        # (monotonic timestamp, stats dict) from the last get_cache_stats()
+        self._stats_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
+        # Close SQLite handles (and checkpoint the WAL) on interpreter exit
+        self._closed = False
+        atexit.register(self.close)
+
+        # Perform initial cleanup in the background so startup is not blocked
+        threading.Thread(
+            target=self._initial_cleanup,
+            name="cache-initial-cleanup",
+            daemon=True
+        ).start()
 
         logger.info(f"Cache initialized at {cache_dir} with {expiry_days} day expiry")
 
+    def close(self) -> None:
+        """Close the underlying cache databases. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+
+        self.ai_evictor.close()
+        self.ai_cache.close()
+        self.pubmed_cache.close()
+
+    def __enter__(self) -> "CacheManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _initial_cleanup(self):
         """Perform initial cleanup of expired entries on startup."""
         try:
@@ -75,10 +408,174 @@ class CacheManager:
             logger.warning(f"Initial cleanup failed: {e}")
 
     def _generate_key(self, data: Dict[str, Any]) -> str:
-        """Generate cache key from data dictionary."""
+        """
+        Generate cache key from data dictionary.
+
+        Uses a 64-bit BLAKE2b digest (16 hex chars). Collisions only become
+        likely around 2^32 entries, far beyond any realistic cache size.
+        """
         # Sort keys for consistent hashing
-        sorted_data = json.dumps(data, sort_keys=True)
-        return hashlib.md5(sorted_data.encode()).hexdigest()
+        sorted_data = json_dumps(data, sort_keys=True)
+        return hashlib.blake2b(sorted_data, digest_size=8).hexdigest()
+
+    def _generate_ai_key(
+        self,
+        prompt: str,
+        provider: str,
+        model: str,
+        params: Dict[str, Any]
+    ) -> str:
+        """
+        Generate cache key for an AI request.
+
+        Fields are streamed into the hash with NUL separators instead of
+        being serialized into one JSON document first, so a large prompt is
+        encoded once and never copied into an intermediate string.
+
+        The provider/model prefix is hashed once and cloned per call. A
+        ``system_prompt`` parameter is folded into that prefix too, so a
+        long shared system prompt is hashed once per process rather than on
+        every request. The AI_KEY_FIELDS follow the prompt in a fixed
+        order, so only any other parameters need sorting and tagging.
+        """
+        system_prompt = params.get("system_prompt")
+        folded = system_prompt is None or isinstance(system_prompt, str)
+        # None, "" and no system prompt at all send the same request
+        if not folded or not system_prompt:
+            system_prompt = None
+
+        extra = [
+            name for name in params
+            if name not in self.AI_KEY_FIELDS
+            and not (folded and name == "system_prompt")
+        ]
+
+        prefix_key = (provider, model, system_prompt)
+        prefix = self._ai_key_prefixes.get(prefix_key)
+        if prefix is None:
+            prefix = hashlib.blake2b(digest_size=8)
+            prefix.update(provider.encode())
+            prefix.update(b"\x00")
+            prefix.update(model.encode())
+            prefix.update(b"\x00")
+            if system_prompt is not None:
+                # Length-prefixed so it can't run into the prompt bytes
+                system_bytes = system_prompt.encode()
+                prefix.update(b"\x01")
+                prefix.update(len(system_bytes).to_bytes(8, "big"))
+                prefix.update(system_bytes)
+
+            if len(self._ai_key_prefixes) >= self.AI_KEY_PREFIX_LIMIT:
+                self._ai_key_prefixes.clear()
+            self._ai_key_prefixes[prefix_key] = prefix
+
+        h = prefix.copy()
+        h.update(prompt.encode())
+        for name in self.AI_KEY_FIELDS:
+            h.update(b"\x00\x02")
+            h.update(self._encode_ai_param(params.get(name)))
+
+        # Common case: no other parameters, nothing to sort or serialize
+        if not extra:
+            return h.hexdigest()
+
+        for name in sorted(extra):
+            h.update(b"\x00")
+            h.update(name.encode())
+            h.update(b"\x00")
+            h.update(self._encode_ai_param(params[name]))
+
+        return h.hexdigest()
+
+    @staticmethod
+    def _encode_ai_param(value: Any) -> bytes:
+        """Encode a parameter value for the AI key, tagged by type so "1" and 1 differ."""
+        if value is None:
+            return b"n"
+        if isinstance(value, str):
+            return b"s" + value.encode()
+        if isinstance(value, int) and not isinstance(value, bool):
+            return b"i" + str(value).encode()
+        if isinstance(value, float):
+            return b"f" + repr(value).encode()
+        return b"j" + json_dumps(value, sort_keys=True)
+
+    def _mem_set(
+        self,
+        memo: OrderedDict,
+        key: str,
+        value: Any,
+        expire_time: Optional[float]
+    ) -> None:
+        """Store a value in an in-memory tier, evicting the least recently used."""
+        with self._mem_lock:
+            memo[key] = (value, expire_time)
+            memo.move_to_end(key)
+            if len(memo) > self._mem_max:
+                memo.popitem(last=False)
+
+    def _cached_get(
+        self,
+        memo: OrderedDict,
+        cache: "diskcache.Cache",
+        key: str,
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        """
+        Read a key from the in-memory tier, falling back to the disk cache.
+
+        Values read from disk are passed through ``decode`` (if given) before
+        being stored in the in-memory tier.
+        """
+        return self._cached_get_entry(memo, cache, key, decode)[0]
+
+    def _cached_get_entry(
+        self,
+        memo: OrderedDict,
+        cache: "diskcache.Cache",
+        key: str,
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> Tuple[Any, Optional[float]]:
+        """Like _cached_get, but also return the entry's expire time."""
+        with self._mem_lock:
+            entry = memo.get(key)
+            if entry is not None:
+                value, expire_time = entry
+                if expire_time is None or expire_time > time.time():
+                    memo.move_to_end(key)
+                    return entry
+                del memo[key]
+
+        value, expire_time = cache.get(key, expire_time=True)
+        if value is not None and decode is not None:
+            value = decode(value)
+        if value is not None:
+            self._mem_set(memo, key, value, expire_time)
+        return value, expire_time
+
+    def make_ai_key(
+        self,
+        prompt: str,
+        provider: str,
+        model: str,
+        **kwargs
+    ) -> str:
+        """
+        Compute the cache key for an AI request.
+
+        Use with get_ai_response_by_key/set_ai_response_by_key to hash a
+        prompt once for a lookup followed by a store on miss.
+
+        Args:
+            prompt: The prompt sent to AI
+            provider: AI provider name
+            model: Model name
+            **kwargs: Additional parameters
+
+        Returns:
+            Cache key
+        """
+        return self._generate_ai_key(prompt, provider, model, kwargs)
 
     def get_ai_response(
         self,
@@ -100,20 +597,99 @@ class CacheManager:
             Cached response or None
         """
         try:
-            cache_key = self._generate_key({
-                "prompt": prompt,
-                "provider": provider,
-                "model": model,
-                **kwargs
-            })
-
-            result = self.ai_cache.get(cache_key)
+            cache_key = self._generate_ai_key(prompt, provider, model, kwargs)
+        except Exception as e:
+            logger.error(f"Error getting AI response from cache: {e}")
+            return None
+
+        return self.get_ai_response_by_key(cache_key)
+
+    def get_ai_response_by_key(self, cache_key: str) -> Optional[str]:
+        """
+        Get cached AI response for a key from make_ai_key().
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached response or None
+        """
+        return self.get_ai_response_entry(cache_key)[0]
+
+    def get_ai_response_entry(self, cache_key: str) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Get a cached AI response together with its expiry.
+
+        Args:
+            cache_key: Key from make_ai_key()
+
+        Returns:
+            (response, expire time as a time.time() timestamp), or
+            (None, None) on a miss
+        """
+        try:
+            result, expire_time = self._cached_get_entry(
+                self._mem_ai, self.ai_cache, cache_key, decode=_decompress_response
+            )
             if result:
+                self.ai_evictor.record_access(cache_key)
                 logger.debug(f"Cache hit for AI request (key: {cache_key[:8]}...)")
-            return result
+                return result, expire_time
         except Exception as e:
             logger.error(f"Error getting AI response from cache: {e}")
-            return None
+        return None, None
+
+    def touch(self, cache_key: str) -> None:
+        """
+        Record a hit for an AI response served from a cache in front of this one.
+
+        Keeps LRU-2 access history accurate for callers (such as
+        AIClientManager's in-process tier) that don't read through
+        get_ai_response_by_key() on every hit.
+
+        Args:
+            cache_key: Key from make_ai_key()
+        """
+        self.ai_evictor.record_access(cache_key)
+
+    def add_ai_invalidation_listener(
+        self,
+        callback: Callable[[Optional[List[str]]], None]
+    ) -> None:
+        """
+        Register a bound method to call when AI responses are dropped.
+
+        Callers keeping their own copies of responses (e.g. AIClientManager's
+        in-process tier) use this to follow evictions and clears. The
+        callback receives the dropped keys, or None when the whole AI cache
+        was cleared. Only a weak reference is kept.
+
+        Args:
+            callback: Bound method taking Optional[List[str]]
+        """
+        with self._mem_lock:
+            self._ai_listeners.append(weakref.WeakMethod(callback))
+
+    def _notify_ai_listeners(self, keys: Optional[List[str]]) -> None:
+        """Pass dropped AI keys (None for all) to the registered listeners."""
+        with self._mem_lock:
+            self._ai_listeners = [ref for ref in self._ai_listeners if ref() is not None]
+            callbacks = [ref() for ref in self._ai_listeners]
+
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(keys)
+            except Exception as e:
+                logger.warning(f"AI cache invalidation listener failed: {e}")
+
+    def _forget_ai_keys(self, keys: List[str]) -> None:
+        """Drop evicted AI keys from the in-memory tier and the listeners."""
+        with self._mem_lock:
+            for key in keys:
+                self._mem_ai.pop(key, None)
+        self._notify_ai_listeners(keys)
 
     def set_ai_response(
         self,
@@ -134,21 +710,44 @@ class CacheManager:
             **kwargs: Additional parameters
         """
         try:
-            cache_key = self._generate_key({
-                "prompt": prompt,
-                "provider": provider,
-                "model": model,
-                **kwargs
-            })
+            cache_key = self._generate_ai_key(prompt, provider, model, kwargs)
+        except Exception as e:
+            logger.error(f"Error caching AI response: {e}")
+            return
 
+        self.set_ai_response_by_key(cache_key, response)
+
+    def set_ai_response_by_key(self, cache_key: str, response: str) -> Optional[float]:
+        """
+        Cache AI response under a key from make_ai_key().
+
+        Args:
+            cache_key: Cache key
+            response: AI response to cache
+
+        Returns:
+            Expire time (time.time() timestamp) of the stored entry, or None
+            if it could not be stored or was evicted straight away
+        """
+        expiry_seconds = self.expiry_seconds
+        try:
+            expire_time = time.time() + expiry_seconds
             self.ai_cache.set(
                 cache_key,
-                response,
-                expire=self.expiry_seconds
+                _compress_response(response),
+                expire=expiry_seconds
             )
+            self._mem_set(self._mem_ai, cache_key, response, expire_time)
             logger.debug(f"Cached AI response (key: {cache_key[:8]}...)")
+
+            if self.ai_evictor.record_write(cache_key) and self.ai_evictor.maybe_evict():
+                # A fresh key has a single access, so it may be evicted at once
+                if cache_key not in self.ai_cache:
+                    return None
+            return expire_time
         except Exception as e:
             logger.error(f"Error caching AI response: {e}")
+            return None
 
     def get_pubmed_query(
         self,
@@ -173,7 +772,12 @@ class CacheManager:
             **kwargs
         })
 
-        return self.pubmed_cache.get(cache_key)
+        results = self._cached_get(
+            self._mem_pubmed, self.pubmed_cache, cache_key, decode=_unpack_results
+        )
+
+        # Hand out a copy so callers cannot reorder the shared in-memory list
+        return list(results) if results is not None else None
 
     def set_pubmed_query(
         self,
@@ -199,33 +803,84 @@ class CacheManager:
 
         self.pubmed_cache.set(
             cache_key,
-            results,
+            _pack_results(results),
             expire=self.expiry_seconds
         )
+        self._mem_set(self._mem_pubmed, cache_key, list(results), time.time() + self.expiry_seconds)
+
+    def set_pubmed_queries_batch(self, items: List[Tuple[Dict[str, Any], list]]) -> None:
+        """
+        Cache several PubMed query results in a single disk transaction.
+
+        Args:
+            items: (query_params, results) pairs, where query_params holds the
+                same arguments as set_pubmed_query (query, max_results, ...)
+
+        Example:
+            >>> cache.set_pubmed_queries_batch([
+            ...     ({"query": "diabetes", "max_results": 10}, results_a),
+            ...     ({"query": "asthma", "max_results": 10}, results_b),
+            ... ])
+        """
+        expire_time = time.time() + self.expiry_seconds
+
+        with self.pubmed_cache.transact():
+            for params, results in items:
+                cache_key = self._generate_key(params)
+                self.pubmed_cache.set(
+                    cache_key,
+                    _pack_results(results),
+                    expire=self.expiry_seconds
+                )
+                self._mem_set(self._mem_pubmed, cache_key, list(results), expire_time)
+
+    def ai_transaction(self):
+        """
+        Context manager grouping several AI cache writes into one transaction.
+
+        Example:
+            >>> with cache.ai_transaction():
+            ...     for prompt, response in pairs:
+            ...         cache.set_ai_response(prompt, "claude", model, response)
+        """
+        return self.ai_cache.transact()
 
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get comprehensive cache statistics including hit rates."""
+        """
+        Get comprehensive cache statistics including hit rates.
+
+        Results are reused for STATS_TTL seconds so that dashboards polling
+        this method don't hit SQLite on every refresh.
+        """
+        timestamp, stats = self._stats_cache
+        if stats is not None and time.monotonic() - timestamp < self.STATS_TTL:
+            return stats
+
         try:
-            ai_stats = self.ai_cache.stats(enable=True)
-            pubmed_stats = self.pubmed_cache.stats(enable=True)
+            ai_hits, ai_misses = self.ai_cache.stats(enable=True)
+            pubmed_hits, pubmed_misses = self.pubmed_cache.stats(enable=True)
+            ai_bytes = self.ai_cache.volume()
+            pubmed_bytes = self.pubmed_cache.volume()
 
-            return {
+            stats = {
                 "ai_cache": {
                     "size": len(self.ai_cache),
-                    "bytes": self.ai_cache.volume(),
-                    "hits": ai_stats.get('hits', 0),
-                    "misses": ai_stats.get('misses', 0),
+                    "bytes": ai_bytes,
+                    "hits": ai_hits,
+                    "misses": ai_misses,
                     "size_limit_mb": self.ai_cache.size_limit / (1024 * 1024)
                 },
                 "pubmed_cache": {
                     "size": len(self.pubmed_cache),
-                    "bytes": self.pubmed_cache.volume(),
-                    "hits": pubmed_stats.get('hits', 0),
-                    "misses": pubmed_stats.get('misses', 0),
+                    "bytes": pubmed_bytes,
+                    "hits": pubmed_hits,
+                    "misses": pubmed_misses,
                     "size_limit_mb": self.pubmed_cache.size_limit / (1024 * 1024)
                 },
-                "total_bytes": self.ai_cache.volume() + self.pubmed_cache.volume()
+                "total_bytes": ai_bytes + pubmed_bytes
             }
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
             return {
@@ -243,24 +898,34 @@ class CacheManager:
         """
         if cache_type in ["ai", "all"]:
             self.ai_cache.clear()
+            self.ai_evictor.clear()
+            with self._mem_lock:
+                self._mem_ai.clear()
+            self._notify_ai_listeners(None)
 
         if cache_type in ["pubmed", "all"]:
             self.pubmed_cache.clear()
+            with self._mem_lock:
+                self._mem_pubmed.clear()
+
+        # Don't report pre-clear sizes from the stats cache
+        self._stats_cache = (0.0, None)
 
     def cleanup_expired(self) -> int:
         """Remove expired cache entries. Returns number of entries removed."""
+        # diskcache deletes expired rows in bulk using its expire_time index;
+        # the two caches are separate SQLite databases, so expire them in parallel
         removed = 0
-
-        # AI cache cleanup
-        for key in list(self.ai_cache):
-            if self.ai_cache.get(key) is None:
-                removed += 1
-
-        # PubMed cache cleanup
-        for key in list(self.pubmed_cache):
-            if self.pubmed_cache.get(key) is None:
-                removed += 1
-
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-expire") as executor:
+            futures = {
+                executor.submit(self.ai_cache.expire): "ai",
+                executor.submit(self.pubmed_cache.expire): "pubmed"
+            }
+            for future in as_completed(futures):
+                try:
+                    removed += future.result()
+                except Exception as e:
+                    logger.warning(f"Expiring {futures[future]} cache failed: {e}")
         return removed
 
 
@@ -300,6 +965,17 @@ if __name__ == "__main__":
 
     print(f"Cached response: {cached}")
 
+    # Hash once for a lookup followed by a store on miss
+    key = cache.make_ai_key(
+        prompt="What is metformin?",
+        provider="claude",
+        model="claude-3-5-sonnet"
+    )
+    if cache.get_ai_response_by_key(key) is None:
+        cache.set_ai_response_by_key(key, "Metformin is a first-line therapy...")
+
+    print(f"Cached by key: {cache.get_ai_response_by_key(key)}")
+
     # Test PubMed caching
     cache.set_pubmed_query(
         query="diabetes",
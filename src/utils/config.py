@@ -6,16 +6,14 @@ and default values.
 """
 import os
 import logging
+import functools
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
-from dotenv import load_dotenv
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AIProviderConfig:
     """Configuration for AI providers."""
     anthropic_api_key: Optional[str] = None
@@ -24,14 +22,14 @@ class AIProviderConfig:
     default_provider: str = "claude"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PubMedConfig:
     """Configuration for PubMed client."""
     email: str = "user@example.com"
     request_delay: float = 0.34  # 3 requests per second
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
     """Configuration for caching."""
     enabled: bool = True
@@ -40,16 +38,16 @@ class CacheConfig:
     size_limit_mb: int = 500
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CostConfig:
     """Configuration for cost tracking."""
     enabled: bool = True
     daily_limit: float = 10.0
     monthly_limit: float = 100.0
-    storage_path: str = "./cache/usage_stats.json"
+    storage_path: str = "./cache/usage_stats.db"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Configuration for logging."""
     level: str = "INFO"
@@ -57,7 +55,7 @@ class LogConfig:
     file: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration."""
     ai: AIProviderConfig
@@ -74,7 +72,8 @@ class AppConfig:
         Returns:
             AppConfig instance with validated settings
         """
-        # Load .env file
+        # Load .env file (imported lazily to keep module import cheap)
+        from dotenv import load_dotenv
         load_dotenv()
 
         # AI Provider Config
@@ -104,7 +103,7 @@ class AppConfig:
             enabled=os.getenv("COST_TRACKING_ENABLED", "true").lower() == "true",
             daily_limit=float(os.getenv("COST_DAILY_LIMIT", "10.0")),
             monthly_limit=float(os.getenv("COST_MONTHLY_LIMIT", "100.0")),
-            storage_path=os.getenv("COST_STORAGE_PATH", "./cache/usage_stats.json")
+            storage_path=os.getenv("COST_STORAGE_PATH", "./cache/usage_stats.db")
         )
 
         # Log Config
@@ -220,36 +219,33 @@ class AppConfig:
         }
 
 
-# Global configuration instance
-_config: Optional[AppConfig] = None
-
-
+@functools.cache
 def get_config() -> AppConfig:
     """
     Get or create global configuration instance.
 
+    The validated configuration is cached for the process lifetime; call
+    ``get_config.cache_clear()`` to reload it from the environment.
+
     Returns:
         AppConfig instance
     """
-    global _config
-
-    if _config is None:
-        _config = AppConfig.from_env()
+    config = AppConfig.from_env()
 
-        # Validate configuration
-        validation = _config.validate()
+    # Validate configuration
+    validation = config.validate()
 
-        if not validation["valid"]:
-            for error in validation["errors"]:
-                logger.error(f"Configuration error: {error}")
-            raise ValueError("Invalid configuration. Check logs for details.")
+    if not validation["valid"]:
+        for error in validation["errors"]:
+            logger.error(f"Configuration error: {error}")
+        raise ValueError("Invalid configuration. Check logs for details.")
 
-        for warning in validation["warnings"]:
-            logger.warning(f"Configuration warning: {warning}")
+    for warning in validation["warnings"]:
+        logger.warning(f"Configuration warning: {warning}")
 
-        logger.info("Configuration loaded and validated successfully")
+    logger.info("Configuration loaded and validated successfully")
 
-    return _config
+    return config
 
 
 # Example usage
@@ -2,15 +2,29 @@
 Cost tracking and quota management for AI API usage.
 Helps monitor spending and prevent overages.
 """
-import json
-from typing import Dict, Optional, List
+import atexit
+import bisect
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 import threading
 
+from .json_utils import loads as json_loads
 
-@dataclass
+try:
+    import numpy as np
+except ImportError:  # Optional: windowed stats fall back to a Python loop
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class UsageRecord:
     """Record of a single API usage."""
     timestamp: str
@@ -21,6 +35,134 @@ class UsageRecord:
     total_tokens: int
     estimated_cost: float
     operation: str  # summarize, synthesize, qa, etc.
+    # Parsed once from timestamp; not persisted
+    parsed_time: datetime = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.parsed_time = datetime.fromisoformat(self.timestamp)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to a plain dictionary of the stored fields.
+
+        Cheaper than dataclasses.asdict (no recursive copy) and leaves out
+        the derived parsed_time.
+        """
+        return {
+            "timestamp": self.timestamp,
+            "provider": self.provider,
+            "model": self.model,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "estimated_cost": self.estimated_cost,
+            "operation": self.operation
+        }
+
+    def to_row(self) -> tuple:
+        """Convert to a row of the usage table."""
+        return (
+            self.parsed_time.timestamp(),
+            self.timestamp,
+            self.provider,
+            self.model,
+            self.prompt_tokens,
+            self.completion_tokens,
+            self.total_tokens,
+            self.estimated_cost,
+            self.operation
+        )
+
+
+class _UsageColumns:
+    """
+    Column-oriented copy of the usage history for vectorized statistics.
+
+    Holds one NumPy array per numeric field, in the same (time-sorted)
+    order as CostTracker.usage_records. Providers and operations are
+    stored as small integer ids so per-group totals are a single
+    np.bincount. Arrays grow by doubling.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.costs = np.empty(capacity, dtype=np.float64)
+        self.tokens = np.empty(capacity, dtype=np.int64)
+        self.provider_ids = np.empty(capacity, dtype=np.int32)
+        self.operation_ids = np.empty(capacity, dtype=np.int32)
+        self.providers: List[str] = []
+        self.operations: List[str] = []
+        self._provider_index: Dict[str, int] = {}
+        self._operation_index: Dict[str, int] = {}
+
+    @staticmethod
+    def _intern(name: str, names: List[str], index: Dict[str, int]) -> int:
+        """Return the id for a name, assigning a new one if needed."""
+        name_id = index.get(name)
+        if name_id is None:
+            name_id = index[name] = len(names)
+            names.append(name)
+        return name_id
+
+    def append(self, record: UsageRecord):
+        """Append one record."""
+        if self.size == len(self.costs):
+            capacity = 2 * len(self.costs)
+            for attr in ("costs", "tokens", "provider_ids", "operation_ids"):
+                old = getattr(self, attr)
+                new = np.empty(capacity, dtype=old.dtype)
+                new[:self.size] = old[:self.size]
+                setattr(self, attr, new)
+
+        i = self.size
+        self.costs[i] = record.estimated_cost
+        self.tokens[i] = record.total_tokens
+        self.provider_ids[i] = self._intern(
+            record.provider, self.providers, self._provider_index
+        )
+        self.operation_ids[i] = self._intern(
+            record.operation, self.operations, self._operation_index
+        )
+        self.size += 1
+
+    def provider_cost(self, start: int, provider: str) -> float:
+        """Total cost of records[start:] for one provider."""
+        provider_id = self._provider_index.get(provider)
+        if provider_id is None:
+            return 0.0
+        window = slice(start, self.size)
+        return float(self.costs[window][self.provider_ids[window] == provider_id].sum())
+
+    def stats(self, start: int) -> Dict:
+        """Compute CostTracker-style statistics for records[start:]."""
+        window = slice(start, self.size)
+        costs = self.costs[window]
+        tokens = self.tokens[window]
+
+        stats = {
+            "total_cost": float(costs.sum()),
+            "total_tokens": int(tokens.sum()),
+            "total_requests": len(costs),
+            "by_provider": {},
+            "by_operation": {}
+        }
+
+        for group, ids, names in (
+            ("by_provider", self.provider_ids[window], self.providers),
+            ("by_operation", self.operation_ids[window], self.operations)
+        ):
+            group_costs = np.bincount(ids, weights=costs, minlength=len(names))
+            group_tokens = np.bincount(ids, weights=tokens, minlength=len(names))
+            group_requests = np.bincount(ids, minlength=len(names))
+
+            for name_id in np.flatnonzero(group_requests):
+                stats[group][names[name_id]] = {
+                    "cost": float(group_costs[name_id]),
+                    "tokens": int(group_tokens[name_id]),
+                    "requests": int(group_requests[name_id])
+                }
+
+        return stats
 
 
 class CostTracker:
@@ -48,48 +190,247 @@ class CostTracker:
         }
     }
 
-    def __init__(self, storage_path: str = "./cache/usage_stats.json"):
+    # Prompt-cache reads and writes, as multiples of the input price
+    # (Anthropic: reads 0.1x, 5-minute cache writes 1.25x)
+    CACHE_READ_MULTIPLIER = 0.1
+    CACHE_WRITE_MULTIPLIER = 1.25
+
+    # Buffered records are written once this many are pending...
+    FLUSH_EVERY = 32
+    # ...or once this many seconds have passed since the last write
+    FLUSH_INTERVAL = 5.0
+
+    # Windows with at least this many records use the NumPy columns
+    VECTORIZE_MIN_RECORDS = 512
+
+    def __init__(self, storage_path: str = "./cache/usage_stats.db"):
         """
         Initialize cost tracker.
 
         Args:
-            storage_path: Path to store usage statistics
+            storage_path: Path of the SQLite database storing usage
+                statistics. A ``.json`` path (the old JSON storage) is
+                mapped to the ``.db`` file next to it and imported once.
         """
-        self.storage_path = Path(storage_path)
+        storage_path = Path(storage_path)
+        if storage_path.suffix == ".json":
+            storage_path = storage_path.with_suffix(".db")
+        self.storage_path = storage_path
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.usage_records: List[UsageRecord] = []
         self.lock = threading.Lock()
 
+        # PRICING flattened to (input, output) USD per token
+        self._price: Dict[Tuple[str, str], Tuple[float, float]] = {
+            (provider, model): (pricing["input"] / 1_000_000, pricing["output"] / 1_000_000)
+            for provider, models in self.PRICING.items()
+            for model, pricing in models.items()
+        }
+        self._default_price: Dict[str, Tuple[float, float]] = {
+            provider: self._price[(provider, next(iter(models)))]
+            for provider, models in self.PRICING.items()
+            if models
+        }
+
+        # Index over usage_records, which are kept sorted by timestamp:
+        # epoch seconds per record, and running cost totals where
+        # _cost_prefix[i] is the summed cost of usage_records[:i]
+        self._timestamps: List[float] = []
+        self._cost_prefix: List[float] = [0.0]
+        # All-time aggregates, updated as records are added
+        self._stats = self._empty_stats()
+        # NumPy columns for windowed stats (None without numpy)
+        self._columns: Optional[_UsageColumns] = None
+
+        # Records not yet written to disk; flushed every FLUSH_EVERY records
+        # or FLUSH_INTERVAL seconds, and at interpreter exit
+        self._pending: List[UsageRecord] = []
+        self._last_flush = time.monotonic()
+
+        self._conn = self._connect()
+        self._import_legacy_records()
         self._load_records()
+        self._rebuild_index()
+
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the usage database, creating the schema if needed."""
+        conn = sqlite3.connect(str(self.storage_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                " ts REAL NOT NULL,"
+                " timestamp TEXT NOT NULL,"
+                " provider TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " prompt_tokens INTEGER NOT NULL,"
+                " completion_tokens INTEGER NOT NULL,"
+                " total_tokens INTEGER NOT NULL,"
+                " cost REAL NOT NULL,"
+                " operation TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_usage_ts ON usage(ts)")
+        return conn
+
+    def _import_legacy_records(self):
+        """
+        Import records from the old JSON storage, if present.
+
+        Reads both the JSON-array and the JSON Lines formats, inserts the
+        records and renames the file to ``*.json.migrated``.
+        """
+        legacy_path = self.storage_path.with_suffix(".json")
+        if not legacy_path.exists():
+            return
+
+        try:
+            with open(legacy_path, 'rb') as f:
+                data = f.read()
+
+            if data.lstrip().startswith(b'['):
+                records = [UsageRecord(**record) for record in json_loads(data)]
+            else:
+                records = []
+                for line in data.splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(UsageRecord(**json_loads(line)))
+                    except Exception as e:
+                        # e.g. a line truncated by a crash mid-append
+                        logger.warning("Skipping unreadable usage record: %s", e)
+
+            # Keep the legacy file (and retry next start) if the insert failed
+            if not self._append_records(records):
+                return
+            os.replace(legacy_path, legacy_path.with_name(legacy_path.name + ".migrated"))
+        except Exception:
+            logger.exception("Failed to import legacy usage records")
 
     def _load_records(self):
-        """Load usage records from disk."""
-        if self.storage_path.exists():
-            try:
-                with open(self.storage_path, 'r') as f:
-                    data = json.load(f)
-                    self.usage_records = [
-                        UsageRecord(**record) for record in data
-                    ]
-            except Exception as e:
-                print(f"Error loading usage records: {e}")
-
-    def _save_records(self):
-        """Save usage records to disk."""
+        """Load usage records from the database, oldest first."""
         try:
-            with open(self.storage_path, 'w') as f:
-                data = [asdict(record) for record in self.usage_records]
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving usage records: {e}")
+            rows = self._conn.execute(
+                "SELECT timestamp, provider, model, prompt_tokens,"
+                " completion_tokens, total_tokens, cost, operation"
+                " FROM usage ORDER BY ts"
+            )
+            self.usage_records = [UsageRecord(*row) for row in rows]
+        except Exception:
+            logger.exception("Failed to load usage records")
+
+    def _append_records(self, records: List[UsageRecord]) -> bool:
+        """
+        Insert usage records in a single transaction.
+
+        Returns:
+            True if the records were written
+        """
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO usage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [record.to_row() for record in records]
+                )
+            return True
+        except Exception:
+            logger.exception("Failed to save usage records")
+            return False
+
+    def _flush_locked(self):
+        """
+        Write pending records to disk. Caller must hold self.lock.
+
+        Records stay buffered if the write fails, so the next flush retries them.
+        """
+        if self._pending and self._append_records(self._pending):
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """Write any buffered usage records to disk."""
+        with self.lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush buffered records and close the database. Safe to call twice."""
+        with self.lock:
+            if self._conn is None:
+                return
+            self._flush_locked()
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        """Return a zeroed statistics dictionary."""
+        return {
+            "total_cost": 0.0,
+            "total_tokens": 0,
+            "total_requests": 0,
+            "by_provider": {},
+            "by_operation": {}
+        }
+
+    @staticmethod
+    def _add_to_stats(stats: Dict, record: UsageRecord):
+        """Accumulate a single record into a statistics dictionary."""
+        stats["total_cost"] += record.estimated_cost
+        stats["total_tokens"] += record.total_tokens
+        stats["total_requests"] += 1
+
+        for group, name in (
+            ("by_provider", record.provider),
+            ("by_operation", record.operation)
+        ):
+            entry = stats[group].get(name)
+            if entry is None:
+                entry = stats[group][name] = {
+                    "cost": 0.0,
+                    "tokens": 0,
+                    "requests": 0
+                }
+            entry["cost"] += record.estimated_cost
+            entry["tokens"] += record.total_tokens
+            entry["requests"] += 1
+
+    def _index_record(self, record: UsageRecord):
+        """Add a record (the newest one) to the index and aggregates."""
+        self._timestamps.append(record.parsed_time.timestamp())
+        self._cost_prefix.append(self._cost_prefix[-1] + record.estimated_cost)
+        self._add_to_stats(self._stats, record)
+        if self._columns is not None:
+            self._columns.append(record)
+
+    def _rebuild_index(self):
+        """Sort records by time and recompute the index and aggregates."""
+        self.usage_records.sort(key=lambda record: record.parsed_time)
+        self._timestamps = []
+        self._cost_prefix = [0.0]
+        self._stats = self._empty_stats()
+        self._columns = _UsageColumns() if np is not None else None
+        for record in self.usage_records:
+            self._index_record(record)
+
+    def _start_index(self, since: Optional[datetime]) -> int:
+        """Index of the first record at or after ``since``."""
+        if since is None:
+            return 0
+        return bisect.bisect_left(self._timestamps, since.timestamp())
 
     def estimate_cost(
         self,
         provider: str,
         model: str,
         prompt_tokens: int,
-        completion_tokens: int
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0
     ) -> float:
         """
         Estimate cost for given usage.
@@ -97,25 +438,29 @@ class CostTracker:
         Args:
             provider: AI provider name
             model: Model name
-            prompt_tokens: Number of input tokens
+            prompt_tokens: Number of input tokens, including cache reads/writes
             completion_tokens: Number of output tokens
+            cached_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Estimated cost in USD
         """
-        if provider not in self.PRICING:
-            return 0.0
-
-        if model not in self.PRICING[provider]:
+        price = self._price.get((provider, model))
+        if price is None:
             # Use first available model pricing as fallback
-            model = list(self.PRICING[provider].keys())[0]
-
-        pricing = self.PRICING[provider][model]
-
-        input_cost = (prompt_tokens / 1_000_000) * pricing["input"]
-        output_cost = (completion_tokens / 1_000_000) * pricing["output"]
-
-        return input_cost + output_cost
+            price = self._default_price.get(provider)
+            if price is None:
+                return 0.0
+
+        input_price, output_price = price
+        uncached_tokens = prompt_tokens - cached_tokens - cache_write_tokens
+        return (
+            uncached_tokens * input_price
+            + cached_tokens * input_price * self.CACHE_READ_MULTIPLIER
+            + cache_write_tokens * input_price * self.CACHE_WRITE_MULTIPLIER
+            + completion_tokens * output_price
+        )
 
     def record_usage(
         self,
@@ -123,23 +468,31 @@ class CostTracker:
         model: str,
         prompt_tokens: int,
         completion_tokens: int,
-        operation: str = "unknown"
+        operation: str = "unknown",
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0
     ) -> float:
         """
         Record API usage and return estimated cost.
 
+        The record is buffered and written to disk in batches; call
+        flush() to persist it immediately.
+
         Args:
             provider: AI provider name
             model: Model name
             prompt_tokens: Number of input tokens
             completion_tokens: Number of output tokens
             operation: Type of operation performed
+            cached_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Estimated cost in USD
         """
         cost = self.estimate_cost(
-            provider, model, prompt_tokens, completion_tokens
+            provider, model, prompt_tokens, completion_tokens,
+            cached_tokens, cache_write_tokens
         )
 
         record = UsageRecord(
@@ -155,7 +508,17 @@ class CostTracker:
 
         with self.lock:
             self.usage_records.append(record)
-            self._save_records()
+            if self._timestamps and record.parsed_time.timestamp() < self._timestamps[-1]:
+                # Clock went backwards; keep the history sorted
+                self._rebuild_index()
+            else:
+                self._index_record(record)
+            self._pending.append(record)
+            if (
+                len(self._pending) >= self.FLUSH_EVERY
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+            ):
+                self._flush_locked()
 
         return cost
 
@@ -174,22 +537,31 @@ class CostTracker:
         Returns:
             Total cost in USD
         """
-        total = 0.0
+        with self.lock:
+            start = self._start_index(since)
 
-        for record in self.usage_records:
-            # Filter by provider
-            if provider and record.provider != provider:
-                continue
+            if not provider:
+                return self._cost_prefix[-1] - self._cost_prefix[start]
 
-            # Filter by date
-            if since:
-                record_time = datetime.fromisoformat(record.timestamp)
-                if record_time < since:
-                    continue
+            if start == 0:
+                entry = self._stats["by_provider"].get(provider)
+                return entry["cost"] if entry else 0.0
 
-            total += record.estimated_cost
+            if start == len(self.usage_records):
+                # Nothing recorded since the cutoff
+                return 0.0
 
-        return total
+            if (
+                self._columns is not None
+                and len(self.usage_records) - start >= self.VECTORIZE_MIN_RECORDS
+            ):
+                return self._columns.provider_cost(start, provider)
+
+            return sum(
+                record.estimated_cost
+                for record in self.usage_records[start:]
+                if record.provider == provider
+            )
 
     def get_usage_stats(
         self,
@@ -204,52 +576,36 @@ class CostTracker:
         Returns:
             Dictionary with usage statistics
         """
-        stats = {
-            "total_cost": 0.0,
-            "total_tokens": 0,
-            "total_requests": 0,
-            "by_provider": {},
-            "by_operation": {}
-        }
-
-        for record in self.usage_records:
-            # Filter by date
-            if since:
-                record_time = datetime.fromisoformat(record.timestamp)
-                if record_time < since:
-                    continue
-
-            # Update totals
-            stats["total_cost"] += record.estimated_cost
-            stats["total_tokens"] += record.total_tokens
-            stats["total_requests"] += 1
-
-            # By provider
-            if record.provider not in stats["by_provider"]:
-                stats["by_provider"][record.provider] = {
-                    "cost": 0.0,
-                    "tokens": 0,
-                    "requests": 0
-                }
-
-            stats["by_provider"][record.provider]["cost"] += record.estimated_cost
-            stats["by_provider"][record.provider]["tokens"] += record.total_tokens
-            stats["by_provider"][record.provider]["requests"] += 1
+        with self.lock:
+            if since is None:
+                return self._copy_stats(self._stats)
 
-            # By operation
-            if record.operation not in stats["by_operation"]:
-                stats["by_operation"][record.operation] = {
-                    "cost": 0.0,
-                    "tokens": 0,
-                    "requests": 0
-                }
+            start = self._start_index(since)
+            if (
+                self._columns is not None
+                and len(self.usage_records) - start >= self.VECTORIZE_MIN_RECORDS
+            ):
+                return self._columns.stats(start)
 
-            stats["by_operation"][record.operation]["cost"] += record.estimated_cost
-            stats["by_operation"][record.operation]["tokens"] += record.total_tokens
-            stats["by_operation"][record.operation]["requests"] += 1
+            stats = self._empty_stats()
+            for record in self.usage_records[start:]:
+                self._add_to_stats(stats, record)
 
         return stats
 
+    @staticmethod
+    def _copy_stats(stats: Dict) -> Dict:
+        """Copy a statistics dictionary so callers can't mutate the aggregates."""
+        return {
+            **stats,
+            "by_provider": {
+                name: dict(entry) for name, entry in stats["by_provider"].items()
+            },
+            "by_operation": {
+                name: dict(entry) for name, entry in stats["by_operation"].items()
+            }
+        }
+
     def check_quota(
         self,
         daily_limit: float,
@@ -267,13 +623,15 @@ class CostTracker:
         """
         now = datetime.now()
 
-        daily_cost = self.get_total_cost(
-            since=now - timedelta(days=1)
-        )
+        # Both windows end now, so both totals come from one consistent
+        # snapshot of the prefix sums
+        with self.lock:
+            # Quota checks gate spending, so persist what they counted
+            self._flush_locked()
 
-        monthly_cost = self.get_total_cost(
-            since=now - timedelta(days=30)
-        )
+            total = self._cost_prefix[-1]
+            daily_cost = total - self._cost_prefix[self._start_index(now - timedelta(days=1))]
+            monthly_cost = total - self._cost_prefix[self._start_index(now - timedelta(days=30))]
 
         return {
             "daily_within_limit": daily_cost < daily_limit,
@@ -298,9 +656,20 @@ class CostTracker:
         with self.lock:
             self.usage_records = [
                 record for record in self.usage_records
-                if datetime.fromisoformat(record.timestamp) >= cutoff
+                if record.parsed_time >= cutoff
+            ]
+            self._rebuild_index()
+            self._pending = [
+                record for record in self._pending
+                if record.parsed_time >= cutoff
             ]
-            self._save_records()
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM usage WHERE ts < ?", (cutoff.timestamp(),)
+                    )
+            except Exception:
+                logger.exception("Failed to delete old usage records")
 
 
 # Global cost tracker instance
@@ -0,0 +1,60 @@
+"""
+Fast JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. ``dumps`` always returns bytes so the result can be
+hashed or written to a binary file directly.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Sort dictionary keys (for deterministic output)
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        # Accept int/float dict keys like the stdlib does, so both paths
+        # produce the same bytes (and the same cache keys)
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -10,6 +10,24 @@ from pathlib import Path
 from typing import Optional
 from logging.handlers import RotatingFileHandler
 
+from .json_utils import dumps as json_dumps
+
+
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+def _level(name: str) -> int:
+    """Resolve a level name like "info" to its logging constant."""
+    name = name.upper()
+    level = _LEVELS.get(name)
+    if level is None:
+        # Aliases such as WARN or FATAL
+        level = getattr(logging, name)
+    return level
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output for console."""
@@ -23,16 +41,48 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Colored level names, built once instead of per record
+        self._colored_levels = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
+
     def format(self, record):
         """Format log record with colors."""
         # Add color to level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-            )
+        colored = self._colored_levels.get(levelname)
+        if colored is not None:
+            record.levelname = colored
+
+        try:
+            return super().format(record)
+        finally:
+            # The record is shared with other handlers (e.g. the log file)
+            record.levelname = levelname
 
-        return super().format(record)
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that emits one JSON object per line (for log files)."""
+
+    def format(self, record):
+        """Format log record as a JSON line."""
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        return json_dumps(entry).decode("utf-8")
 
 
 def setup_logging(
@@ -40,7 +90,8 @@ def setup_logging(
     log_file: Optional[str] = None,
     format_string: Optional[str] = None,
     max_file_size_mb: int = 10,
-    backup_count: int = 5
+    backup_count: int = 5,
+    json_file: bool = True
 ) -> None:
     """
     Configure application-wide logging.
@@ -51,13 +102,17 @@ def setup_logging(
         format_string: Custom format string
         max_file_size_mb: Maximum size of log file before rotation
         backup_count: Number of backup files to keep
+        json_file: Write the log file as JSON lines instead of using
+            format_string
 
     Example:
         >>> setup_logging(level="DEBUG", log_file="app.log")
     """
+    log_level = _level(level)
+
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.setLevel(log_level)
 
     # Remove existing handlers
     root_logger.handlers = []
@@ -66,12 +121,15 @@ def setup_logging(
     if format_string is None:
         format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-    # Console handler with colors
+    # Console handler, with colors only when writing to a terminal
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(log_level)
 
-    # Use colored formatter for console
-    console_formatter = ColoredFormatter(format_string)
+    isatty = getattr(sys.stdout, "isatty", None)
+    if isatty is not None and isatty():
+        console_formatter = ColoredFormatter(format_string)
+    else:
+        console_formatter = logging.Formatter(format_string)
     console_handler.setFormatter(console_formatter)
 
     root_logger.addHandler(console_handler)
@@ -90,10 +148,13 @@ def setup_logging(
                 backupCount=backup_count,
                 encoding='utf-8'
             )
-            file_handler.setLevel(getattr(logging, level.upper()))
+            file_handler.setLevel(log_level)
 
-            # Use plain formatter for file
-            file_formatter = logging.Formatter(format_string)
+            # Structured JSON lines for file, unless plain text is requested
+            if json_file:
+                file_formatter = JsonFormatter()
+            else:
+                file_formatter = logging.Formatter(format_string)
             file_handler.setFormatter(file_formatter)
 
             root_logger.addHandler(file_handler)
@@ -135,7 +196,7 @@ class LogContext:
             level: Temporary logging level
         """
         self.logger = logger
-        self.new_level = getattr(logging, level.upper())
+        self.new_level = _level(level)
         self.old_level = None
 
     def __enter__(self):
@@ -2,8 +2,13 @@
 Retry handler with exponential backoff and fallback strategies.
 Improves reliability of AI Agent operations.
 """
+import asyncio
+import random
+import threading
 import time
 import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
 from typing import Callable, Optional, List, Any, Type
 import logging
 
@@ -19,7 +24,8 @@ class RetryHandler:
         max_retries: int = 3,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
-        exponential_base: float = 2.0
+        exponential_base: float = 2.0,
+        jitter: bool = True
     ):
         """
         Initialize retry handler.
@@ -29,16 +35,27 @@ class RetryHandler:
             base_delay: Initial delay in seconds
             max_delay: Maximum delay between retries
             exponential_base: Base for exponential backoff
+            jitter: Randomize each delay by 0.5x-1.5x so concurrent callers
+                don't retry in lockstep
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
+        self.jitter = jitter
+
+        # The backoff schedule is fixed at construction, so compute it once
+        self._delays = tuple(
+            min(base_delay * (exponential_base ** attempt), max_delay)
+            for attempt in range(max_retries)
+        )
 
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt using exponential backoff."""
-        delay = self.base_delay * (self.exponential_base ** attempt)
-        return min(delay, self.max_delay)
+        delay = self._delays[attempt]
+        if self.jitter:
+            delay = min(delay * random.uniform(0.5, 1.5), self.max_delay)
+        return delay
 
     def retry_with_backoff(
         self,
@@ -85,17 +102,177 @@ class RetryHandler:
 
         raise last_exception
 
+    async def aretry_with_backoff(
+        self,
+        func: Callable,
+        *args,
+        retry_exceptions: tuple = (Exception,),
+        **kwargs
+    ) -> Any:
+        """
+        Async variant of retry_with_backoff.
+
+        Waits with asyncio.sleep instead of time.sleep, so many retrying
+        calls can run concurrently on one event loop. Coroutine functions
+        are awaited; plain functions run in a worker thread.
+
+        Args:
+            func: Function or coroutine function to execute
+            *args: Function arguments
+            retry_exceptions: Tuple of exceptions to retry on
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            Last exception if all retries fail
+        """
+        last_exception = None
+        is_async = asyncio.iscoroutinefunction(func)
+
+        for attempt in range(self.max_retries):
+            try:
+                if is_async:
+                    return await func(*args, **kwargs)
+                return await asyncio.to_thread(func, *args, **kwargs)
+
+            except retry_exceptions as e:
+                last_exception = e
+
+                if attempt < self.max_retries - 1:
+                    delay = self._calculate_delay(attempt)
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{self.max_retries} failed: {str(e)}. "
+                        f"Retrying in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(
+                        f"All {self.max_retries} attempts failed. Last error: {str(e)}"
+                    )
+
+        raise last_exception
+
+
+# Returned by a hedged attempt that was never started
+_SKIPPED = object()
+
+
+def _race_providers(
+    func: Callable,
+    providers: List[str],
+    handler: "RetryHandler",
+    hedge_delay: float,
+    args: tuple,
+    kwargs: dict
+) -> Any:
+    """Run func for every provider in threads; return the first success."""
+    winner = threading.Event()
+
+    def attempt(index: int, provider: str) -> Any:
+        # Stagger launches so earlier (preferred) providers get a head start
+        if index and hedge_delay > 0 and winner.wait(hedge_delay * index):
+            return _SKIPPED
+        logger.info(f"Attempting with provider: {provider}")
+        return handler.retry_with_backoff(func, *args, **{**kwargs, 'provider': provider})
+
+    # At least one worker, so an empty provider list falls through to the
+    # usual "All providers failed" error below
+    executor = ThreadPoolExecutor(
+        max_workers=max(len(providers), 1),
+        thread_name_prefix="provider-race"
+    )
+    futures = {
+        executor.submit(attempt, index, provider): provider
+        for index, provider in enumerate(providers)
+    }
+    last_error = None
+    try:
+        for future in as_completed(futures):
+            provider = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Provider {provider} failed after retries: {str(e)}")
+                continue
+            if result is not _SKIPPED:
+                logger.info(f"Success with provider: {provider}")
+                return result
+    finally:
+        # Losing attempts finish in the background; unstarted ones are dropped
+        winner.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    error_msg = f"All providers failed. Last error: {str(last_error)}"
+    logger.error(error_msg)
+    raise Exception(error_msg)
+
+
+async def _arace_providers(
+    func: Callable,
+    providers: List[str],
+    handler: "RetryHandler",
+    hedge_delay: float,
+    args: tuple,
+    kwargs: dict
+) -> Any:
+    """Run coroutine func for every provider as tasks; return the first success."""
+    async def attempt(index: int, provider: str) -> Any:
+        if index and hedge_delay > 0:
+            await asyncio.sleep(hedge_delay * index)
+        logger.info(f"Attempting with provider: {provider}")
+        return await handler.aretry_with_backoff(func, *args, **{**kwargs, 'provider': provider})
+
+    tasks = {
+        asyncio.create_task(attempt(index, provider)): provider
+        for index, provider in enumerate(providers)
+    }
+    last_error = None
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                provider = tasks[task]
+                error = task.exception()
+                if error is None:
+                    logger.info(f"Success with provider: {provider}")
+                    return task.result()
+                last_error = error
+                logger.warning(f"Provider {provider} failed after retries: {str(error)}")
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    error_msg = f"All providers failed. Last error: {str(last_error)}"
+    logger.error(error_msg)
+    raise Exception(error_msg)
+
 
 def retry_with_fallback(
     providers: List[str],
-    max_retries_per_provider: int = 2
+    max_retries_per_provider: int = 2,
+    race: bool = False,
+    hedge_delay: float = 0.0
 ):
     """
     Decorator for retrying with provider fallback.
 
+    By default providers are tried one after another. With ``race=True``
+    all providers are attempted concurrently and the first success wins,
+    so a dead provider costs no extra latency. ``hedge_delay`` staggers
+    those launches (provider i starts after i * hedge_delay seconds, unless
+    an earlier one already succeeded) to favour the first, usually
+    cheapest, provider. Coroutine functions get an async wrapper whose
+    losing attempts are cancelled.
+
     Args:
         providers: List of provider names to try in order
         max_retries_per_provider: Retries per provider
+        race: Attempt all providers concurrently
+        hedge_delay: Seconds between staggered launches when racing
 
     Example:
         @retry_with_fallback(["claude", "kimi", "qwen"])
@@ -104,6 +281,24 @@ def retry_with_fallback(
             pass
     """
     def decorator(func: Callable) -> Callable:
+        if race and asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_racer(*args, **kwargs):
+                handler = RetryHandler(max_retries=max_retries_per_provider)
+                return await _arace_providers(
+                    func, providers, handler, hedge_delay, args, kwargs
+                )
+            return async_racer
+
+        if race:
+            @functools.wraps(func)
+            def racer(*args, **kwargs):
+                handler = RetryHandler(max_retries=max_retries_per_provider)
+                return _race_providers(
+                    func, providers, handler, hedge_delay, args, kwargs
+                )
+            return racer
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             handler = RetryHandler(max_retries=max_retries_per_provider)
@@ -147,6 +342,11 @@ def with_timeout(timeout_seconds: float):
     """
     Decorator to add timeout to function.
 
+    The function runs in a worker thread, so this works on every platform
+    and from any thread. Python can't kill a running thread: on timeout
+    the caller gets TimeoutError right away while the worker is left to
+    finish in the background.
+
     Args:
         timeout_seconds: Maximum execution time
 
@@ -158,27 +358,23 @@ def with_timeout(timeout_seconds: float):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import signal
-
-            def timeout_handler(signum, frame):
+            executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"timeout-{func.__name__}"
+            )
+            try:
+                future = executor.submit(func, *args, **kwargs)
+                return future.result(timeout=timeout_seconds)
+            except FuturesTimeout as e:
+                # A TimeoutError raised by func itself is passed through as is
+                if future.done() and not future.cancelled() and future.exception() is e:
+                    raise
                 raise TimeoutError(
                     f"Function {func.__name__} exceeded timeout of {timeout_seconds}s"
-                )
-
-            # Set timeout alarm (Unix only)
-            try:
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(int(timeout_seconds))
-
-                result = func(*args, **kwargs)
-
-                signal.alarm(0)  # Cancel alarm
-                return result
-
-            except AttributeError:
-                # Windows doesn't support SIGALRM, just run without timeout
-                logger.warning("Timeout not supported on this platform")
-                return func(*args, **kwargs)
+                ) from None
+            finally:
+                # Don't block on a timed-out worker
+                executor.shutdown(wait=False)
 
         return wrapper
     return decorator
@@ -213,9 +409,13 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
 
         self.failure_count = 0
-        self.last_failure_time = None
+        self.last_failure_time = None  # time.monotonic() of last failure
         self.state = "CLOSED"
 
+        # Taken only for state transitions; the OPEN check reads plain
+        # attributes without it
+        self._lock = threading.Lock()
+
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute function through circuit breaker.
@@ -232,55 +432,66 @@ class CircuitBreaker:
             Exception if circuit is open or function fails
         """
         if self.state == "OPEN":
-            # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "HALF_OPEN"
-                logger.info("Circuit breaker entering HALF_OPEN state")
-            else:
+            # Fast path: reject without locking while still in the timeout
+            if time.monotonic() - self.last_failure_time < self.recovery_timeout:
                 raise Exception(
                     f"Circuit breaker is OPEN. Service unavailable. "
                     f"Retry after {self.recovery_timeout}s"
                 )
 
+            with self._lock:
+                if self.state == "OPEN":
+                    self.state = "HALF_OPEN"
+                    logger.info("Circuit breaker entering HALF_OPEN state")
+
         try:
             result = func(*args, **kwargs)
 
-            # Success - reset failure count
-            if self.state == "HALF_OPEN":
-                self.state = "CLOSED"
-                logger.info("Circuit breaker recovered to CLOSED state")
-
-            self.failure_count = 0
-            return result
-
         except self.expected_exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
+            with self._lock:
+                self.failure_count += 1
+                self.last_failure_time = time.monotonic()
 
-            logger.warning(
-                f"Circuit breaker failure {self.failure_count}/{self.failure_threshold}"
-            )
+                logger.warning(
+                    f"Circuit breaker failure {self.failure_count}/{self.failure_threshold}"
+                )
 
-            if self.failure_count >= self.failure_threshold:
-                self.state = "OPEN"
-                logger.error("Circuit breaker opened due to repeated failures")
+                if self.failure_count >= self.failure_threshold:
+                    self.state = "OPEN"
+                    logger.error("Circuit breaker opened due to repeated failures")
 
             raise e
 
+        # Success - reset failure count (nothing to write in the common case)
+        if self.failure_count or self.state != "CLOSED":
+            with self._lock:
+                if self.state == "HALF_OPEN":
+                    self.state = "CLOSED"
+                    logger.info("Circuit breaker recovered to CLOSED state")
+
+                self.failure_count = 0
+
+        return result
+
 
 # Global circuit breakers for each provider
 _circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_circuit_breaker(provider: str) -> CircuitBreaker:
     """Get or create circuit breaker for provider."""
-    if provider not in _circuit_breakers:
-        _circuit_breakers[provider] = CircuitBreaker(
-            failure_threshold=5,
-            recovery_timeout=60.0
-        )
+    breaker = _circuit_breakers.get(provider)
+    if breaker is None:
+        with _circuit_breakers_lock:
+            breaker = _circuit_breakers.get(provider)
+            if breaker is None:
+                breaker = _circuit_breakers[provider] = CircuitBreaker(
+                    failure_threshold=5,
+                    recovery_timeout=60.0
+                )
 
-    return _circuit_breakers[provider]
+    return breaker
 
 
 # Example usage
@@ -291,7 +502,7 @@ if __name__ == "__main__":
     attempt_count = 0
 
     def flaky_function():
-        nonlocal attempt_count
+        global attempt_count
         attempt_count += 1
 
         if attempt_count < 3:
@@ -302,6 +513,21 @@ if __name__ == "__main__":
     result = handler.retry_with_backoff(flaky_function)
     print(f"Result: {result}, Attempts: {attempt_count}")
 
+    # Test async retry
+    attempt_count = 0
+    result = asyncio.run(handler.aretry_with_backoff(flaky_function))
+    print(f"Async result: {result}, Attempts: {attempt_count}")
+
+    # Test timeout
+    @with_timeout(0.5)
+    def slow_function():
+        time.sleep(2)
+
+    try:
+        slow_function()
+    except TimeoutError as e:
+        print(f"Timeout: {e}")
+
     # Test fallback decorator
     @retry_with_fallback(["claude", "kimi", "qwen"], max_retries_per_provider=2)
     def analyze_text(text, provider=None):
@@ -314,3 +540,12 @@ if __name__ == "__main__":
         print(f"Fallback result: {result}")
     except Exception as e:
         print(f"All providers failed: {e}")
+
+    # Race providers instead of falling back one by one
+    @retry_with_fallback(["claude", "kimi", "qwen"], race=True, hedge_delay=0.1)
+    def race_text(text, provider=None):
+        if provider == "claude":
+            raise Exception("Claude unavailable")
+        return f"Analysis by {provider}"
+
+    print(f"Race result: {race_text('Sample text')}")
@@ -11,11 +11,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.utils import AIClientManager
+from src.utils.cache_manager import get_cache_manager
+
+
 def test_cache_integration():
     """Test that caching is working properly."""
-    from src.utils import AIClientManager
-    from src.utils.cache_manager import get_cache_manager
-
     print("🧪 Testing Cache Integration...")
     print("=" * 50)
 
@@ -65,11 +66,11 @@ def test_cache_integration():
 
     print(f"✓ Second response: {response2[:50]}...")
 
-    # Test 6: Verify responses are identical (cached)
-    if response1 == response2:
-        print(f"✅ Cache HIT! Responses are identical.")
+    # Test 6: Verify the second response was served from cache
+    if manager.last_was_hit():
+        print(f"✅ Cache HIT! Second response served from cache.")
     else:
-        print(f"⚠️  Responses differ (might not be cached)")
+        print(f"⚠️  Cache MISS (response was regenerated)")
 
     # Test 7: Cache statistics
     stats = cache.get_cache_stats()
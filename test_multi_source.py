@@ -4,12 +4,20 @@ Test script for multi-source literature search functionality.
 
 Tests PubMed, Semantic Scholar, and Europe PMC integration.
 """
+import asyncio
+import io
 import sys
+import threading
+import types
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from _http_test_cache import install_test_cache
 from src.data_sources import (
     PubMedClient,
     SemanticScholarClient,
@@ -17,212 +25,383 @@ from src.data_sources import (
     UnifiedSearchClient
 )
 
+_BAR = "=" * 60
 
-def test_pubmed():
-    """Test PubMed client."""
-    print("\n" + "="*60)
-    print("Testing PubMed")
-    print("="*60)
+# Article fields the tests report, with fallbacks for sources that omit them
+_ARTICLE_DEFAULTS = {
+    'title': '',
+    'citation_count': 0,
+    'open_access': False,
+    'pdf_url': '',
+    'source': 'unknown'
+}
+_EXTRACT = itemgetter('title', 'citation_count', 'open_access', 'pdf_url', 'source')
 
-    try:
-        client = PubMedClient()
-        articles = client.search_and_fetch("diabetes", max_results=2)
 
-        print(f"✓ PubMed client initialized")
-        print(f"✓ Found {len(articles)} articles")
+def _extract(article, **defaults):
+    """
+    Get (title, citation_count, open_access, pdf_url, source) in one call.
 
-        if articles:
-            article = articles[0]
-            print(f"\nSample article:")
-            print(f"  Title: {article['title'][:60]}...")
-            print(f"  Authors: {', '.join(article.get('authors', [])[:2])}")
-            print(f"  Source: {article.get('source', 'pubmed')}")
+    Keyword arguments override the fallbacks in _ARTICLE_DEFAULTS.
+    """
+    return _EXTRACT(ChainMap(article, defaults, _ARTICLE_DEFAULTS))
 
-        return True
 
-    except Exception as e:
-        print(f"✗ PubMed test failed: {e}")
-        return False
+class _ThreadBufferedStdout:
+    """
+    Stand-in for sys.stdout that lets worker threads buffer their output.
 
+    Threads that called start_buffer() write into their own StringIO;
+    everything else goes straight to the real stream.
+    """
 
-def test_semantic_scholar():
-    """Test Semantic Scholar client."""
-    print("\n" + "="*60)
-    print("Testing Semantic Scholar")
-    print("="*60)
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def start_buffer(self):
+        self._local.buffer = io.StringIO()
+
+    def stop_buffer(self) -> str:
+        buffer = self._local.buffer
+        del self._local.buffer
+        return buffer.getvalue()
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._stream).flush()
+
+
+def _run_concurrently(tests):
+    """
+    Run independent tests in parallel threads.
+
+    Each test's output is buffered and printed in one piece when it
+    finishes, so banners from different tests don't interleave.
+
+    Returns:
+        Dictionary of test name -> result, in the order given
+    """
+    stdout = sys.stdout
+    buffered = _ThreadBufferedStdout(stdout)
 
+    def run(test):
+        buffered.start_buffer()
+        try:
+            return test(), buffered.stop_buffer()
+        except BaseException:
+            stdout.write(buffered.stop_buffer())
+            raise
+
+    results = {}
+    sys.stdout = buffered
     try:
-        client = SemanticScholarClient()
-        articles = client.search_and_fetch(
-            "machine learning healthcare",
-            max_results=2,
-            fields_of_study=["Medicine", "Computer Science"]
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {executor.submit(run, test): name for name, test in tests}
+            # Only this thread writes to the real stdout, one test at a time
+            for future in as_completed(futures):
+                result, output = future.result()
+                stdout.write(output)
+                results[futures[future]] = result
+    finally:
+        sys.stdout = stdout
+
+    return {name: results[name] for name, _ in tests}
+
+
+# search_all_sources() results shared between tests, keyed on (query, n)
+_CACHE: dict[tuple, types.MappingProxyType] = {}
+
+
+def _cached_search_all(query, n):
+    """
+    Search all sources once per (query, n) and share the result.
+
+    Later tests can look up _CACHE directly to reuse results without
+    triggering a search of their own.
+
+    Returns:
+        Read-only mapping of source name -> article list
+    """
+    key = (query, n)
+    if key not in _CACHE:
+        _CACHE[key] = types.MappingProxyType(
+            UnifiedSearchClient().search_all_sources(query, max_results_per_source=n)
         )
+    return _CACHE[key]
+
 
-        print(f"✓ Semantic Scholar client initialized")
-        print(f"✓ Found {len(articles)} articles")
+class _Reporter:
+    """
+    Collect a test's output lines and write them in a single call.
 
-        if articles:
-            article = articles[0]
-            print(f"\nSample article:")
-            print(f"  Title: {article['title'][:60]}...")
-            print(f"  Citations: {article.get('citation_count', 0)}")
-            print(f"  Open Access: {article.get('open_access', False)}")
-            print(f"  Source: {article.get('source', 'semantic_scholar')}")
-            if article.get('pdf_url'):
-                print(f"  PDF: {article['pdf_url'][:50]}...")
+    Lines are emitted on exit; call flush() to write them out early, e.g.
+    on failure so the message survives if the process dies.
+    """
 
-        return True
+    def __init__(self):
+        self._lines = []
 
-    except Exception as e:
-        print(f"✗ Semantic Scholar test failed: {e}")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
         return False
 
+    def line(self, text=""):
+        self._lines.append(text)
 
-def test_europe_pmc():
-    """Test Europe PMC client."""
-    print("\n" + "="*60)
-    print("Testing Europe PMC")
-    print("="*60)
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
 
-    try:
-        client = EuropePMCClient()
-        articles = client.search_and_fetch("diabetes", max_results=2)
 
-        print(f"✓ Europe PMC client initialized")
-        print(f"✓ Found {len(articles)} articles")
+def test_pubmed():
+    """Test PubMed client."""
+    with _Reporter() as report:
+        report.line("\n" + _BAR)
+        report.line("Testing PubMed")
+        report.line(_BAR)
 
-        if articles:
-            article = articles[0]
-            print(f"\nSample article:")
-            print(f"  Title: {article['title'][:60]}...")
-            print(f"  Journal: {article.get('journal', 'N/A')}")
-            print(f"  Open Access: {article.get('open_access', False)}")
-            print(f"  Source: {article.get('source', 'europe_pmc')}")
+        try:
+            client = PubMedClient()
+            articles = client.search_and_fetch("diabetes", max_results=2)
 
-        return True
+            report.line(f"✓ PubMed client initialized")
+            report.line(f"✓ Found {len(articles)} articles")
 
-    except Exception as e:
-        print(f"✗ Europe PMC test failed: {e}")
-        return False
+            if articles:
+                article = articles[0]
+                title, _, _, _, source = _extract(article, source='pubmed')
+                report.line(f"\nSample article:")
+                report.line(f"  Title: {title[:60]}...")
+                report.line(f"  Authors: {', '.join(article.get('authors', [])[:2])}")
+                report.line(f"  Source: {source}")
 
+            return True
 
-def test_unified_search():
-    """Test unified search client."""
-    print("\n" + "="*60)
-    print("Testing Unified Search")
-    print("="*60)
+        except Exception as e:
+            report.line(f"✗ PubMed test failed: {e}")
+            report.flush()
+            return False
 
-    try:
-        client = UnifiedSearchClient()
-
-        available = client.get_available_sources()
-        print(f"✓ Unified client initialized")
-        print(f"✓ Available sources: {', '.join(available)}")
-
-        # Test single source search
-        print(f"\nTesting single source search...")
-        if 'pubmed' in available:
-            articles = client.search_single_source(
-                source='pubmed',
-                query='diabetes',
-                max_results=1
+
+def test_semantic_scholar():
+    """Test Semantic Scholar client."""
+    with _Reporter() as report:
+        report.line("\n" + _BAR)
+        report.line("Testing Semantic Scholar")
+        report.line(_BAR)
+
+        try:
+            client = SemanticScholarClient()
+            articles = client.search_and_fetch(
+                "machine learning healthcare",
+                max_results=2,
+                fields_of_study=["Medicine", "Computer Science"]
             )
-            print(f"✓ Single source search: {len(articles)} article(s)")
 
-        # Test multi-source search
-        print(f"\nTesting multi-source search...")
-        results = client.search_all_sources(
-            query='machine learning',
-            max_results_per_source=1
-        )
+            report.line(f"✓ Semantic Scholar client initialized")
+            report.line(f"✓ Found {len(articles)} articles")
 
-        total = sum(len(articles) for articles in results.values())
-        print(f"✓ Multi-source search: {total} total articles")
+            if articles:
+                title, citations, open_access, pdf_url, source = _extract(
+                    articles[0], source='semantic_scholar'
+                )
+                report.line(f"\nSample article:")
+                report.line(f"  Title: {title[:60]}...")
+                report.line(f"  Citations: {citations}")
+                report.line(f"  Open Access: {open_access}")
+                report.line(f"  Source: {source}")
+                if pdf_url:
+                    report.line(f"  PDF: {pdf_url[:50]}...")
 
-        for source, articles in results.items():
-            print(f"  - {source}: {len(articles)} article(s)")
+            return True
 
-        # Test merge functionality
-        print(f"\nTesting merge and deduplication...")
-        merged = client.search_and_merge(
-            query='diabetes',
-            max_results_per_source=2,
-            deduplicate=True,
-            sort_by='citation_count'
-        )
+        except Exception as e:
+            report.line(f"✗ Semantic Scholar test failed: {e}")
+            report.flush()
+            return False
 
-        print(f"✓ Merged results: {len(merged)} unique articles")
 
-        if merged:
-            top = merged[0]
-            print(f"\nTop article:")
-            print(f"  Title: {top['title'][:60]}...")
-            print(f"  Source: {top.get('source', 'unknown')}")
-            print(f"  Citations: {top.get('citation_count', 0)}")
+def test_europe_pmc():
+    """Test Europe PMC client."""
+    with _Reporter() as report:
+        report.line("\n" + _BAR)
+        report.line("Testing Europe PMC")
+        report.line(_BAR)
 
-        return True
+        try:
+            client = EuropePMCClient()
+            articles = client.search_and_fetch("diabetes", max_results=2)
 
-    except Exception as e:
-        print(f"✗ Unified search test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+            report.line(f"✓ Europe PMC client initialized")
+            report.line(f"✓ Found {len(articles)} articles")
 
+            if articles:
+                article = articles[0]
+                title, _, open_access, _, source = _extract(article, source='europe_pmc')
+                report.line(f"\nSample article:")
+                report.line(f"  Title: {title[:60]}...")
+                report.line(f"  Journal: {article.get('journal', 'N/A')}")
+                report.line(f"  Open Access: {open_access}")
+                report.line(f"  Source: {source}")
 
-def test_statistics():
-    """Test statistics functionality."""
-    print("\n" + "="*60)
-    print("Testing Statistics")
-    print("="*60)
+            return True
 
-    try:
-        client = UnifiedSearchClient()
+        except Exception as e:
+            report.line(f"✗ Europe PMC test failed: {e}")
+            report.flush()
+            return False
 
-        results = client.search_all_sources(
-            'diabetes treatment',
-            max_results_per_source=5
-        )
 
-        stats = client.get_statistics(results)
+def test_unified_search():
+    """Test unified search client."""
+    with _Reporter() as report:
+        report.line("\n" + _BAR)
+        report.line("Testing Unified Search")
+        report.line(_BAR)
+
+        try:
+            client = UnifiedSearchClient()
+
+            available = client.get_available_sources()
+            report.line(f"✓ Unified client initialized")
+            report.line(f"✓ Available sources: {', '.join(available)}")
+
+            # The three searches are independent, so issue them together
+            async def run_searches():
+                single_search = (
+                    asyncio.to_thread(
+                        client.search_single_source,
+                        source='pubmed',
+                        query='diabetes',
+                        max_results=1
+                    )
+                    if 'pubmed' in available
+                    else asyncio.sleep(0, result=None)
+                )
+                return await asyncio.gather(
+                    single_search,
+                    asyncio.to_thread(_cached_search_all, 'machine learning', 1),
+                    # Fetched through _CACHE so test_statistics can reuse it
+                    asyncio.to_thread(_cached_search_all, 'diabetes', 2)
+                )
+
+            articles, results, diabetes_results = asyncio.run(run_searches())
+
+            # Test single source search
+            report.line(f"\nTesting single source search...")
+            if articles is not None:
+                report.line(f"✓ Single source search: {len(articles)} article(s)")
+
+            # Test multi-source search
+            report.line(f"\nTesting multi-source search...")
+            total = sum(map(len, results.values()))
+            report.line(f"✓ Multi-source search: {total} total articles")
+
+            for source, articles in results.items():
+                report.line(f"  - {source}: {len(articles)} article(s)")
+
+            # Test merge functionality
+            report.line(f"\nTesting merge and deduplication...")
+            merged = client.merge_results(
+                diabetes_results,
+                deduplicate=True,
+                sort_by='citation_count'
+            )
+            report.line(f"✓ Merged results: {len(merged)} unique articles")
 
-        print(f"✓ Statistics generated")
-        print(f"\nStatistics:")
-        print(f"  Total articles: {stats['total_articles']}")
-        print(f"  Open access: {stats['open_access_count']}")
-        print(f"  With PDF: {stats['with_pdf_count']}")
-        print(f"  Avg citations: {stats['avg_citation_count']:.1f}")
+            if merged:
+                title, citations, _, _, source = _extract(merged[0])
+                report.line(f"\nTop article:")
+                report.line(f"  Title: {title[:60]}...")
+                report.line(f"  Source: {source}")
+                report.line(f"  Citations: {citations}")
 
-        print(f"\n  By source:")
-        for source, count in stats['by_source'].items():
-            print(f"    - {source}: {count}")
+            return True
 
-        return True
+        except Exception as e:
+            report.line(f"✗ Unified search test failed: {e}")
+            report.flush()
+            import traceback
+            traceback.print_exc()
+            return False
 
-    except Exception as e:
-        print(f"✗ Statistics test failed: {e}")
-        return False
+
+def test_statistics():
+    """Test statistics functionality."""
+    with _Reporter() as report:
+        report.line("\n" + _BAR)
+        report.line("Testing Statistics")
+        report.line(_BAR)
+
+        try:
+            client = UnifiedSearchClient()
+
+            # Reuse 'diabetes treatment' results if an earlier test cached
+            # them; otherwise stream up to 5 articles per source instead of
+            # materializing them
+            cached = _CACHE.get(('diabetes treatment', 5))
+            if cached is not None:
+                report.line("✓ Reusing cached 'diabetes treatment' results")
+                stats = client.get_statistics(cached)
+            else:
+                stats = client.reduce_stats(
+                    client.iter_search_all(
+                        'diabetes treatment', page_size=5, max_results=5
+                    ),
+                    sources=client.get_available_sources()
+                )
+
+            report.line(f"✓ Statistics generated")
+            report.line(f"\nStatistics:")
+            report.line(f"  Total articles: {stats['total_articles']}")
+            report.line(f"  Open access: {stats['open_access_count']}")
+            report.line(f"  With PDF: {stats['with_pdf_count']}")
+            report.line(f"  Avg citations: {stats['avg_citation_count']:.1f}")
+
+            report.line(f"\n  By source:")
+            for source, count in stats['by_source'].items():
+                report.line(f"    - {source}: {count}")
+
+            return True
+
+        except Exception as e:
+            report.line(f"✗ Statistics test failed: {e}")
+            report.flush()
+            return False
 
 
 def main():
     """Run all tests."""
-    print("\n" + "="*60)
+    install_test_cache()
+
+    print("\n" + _BAR)
     print("Multi-Source Literature Search Tests")
-    print("="*60)
+    print(_BAR)
 
     results = {}
 
-    # Run tests
-    results['PubMed'] = test_pubmed()
-    results['Semantic Scholar'] = test_semantic_scholar()
-    results['Europe PMC'] = test_europe_pmc()
+    # Single-source tests are independent, so run them concurrently; the
+    # unified tests hit the same endpoints again and run afterwards
+    results.update(_run_concurrently([
+        ('PubMed', test_pubmed),
+        ('Semantic Scholar', test_semantic_scholar),
+        ('Europe PMC', test_europe_pmc)
+    ]))
     results['Unified Search'] = test_unified_search()
     results['Statistics'] = test_statistics()
 
     # Summary
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("Test Summary")
-    print("="*60)
+    print(_BAR)
 
     for test_name, passed in results.items():
         status = "✓ PASS" if passed else "✗ FAIL"